@@ -224,6 +224,11 @@ class Address:
         r"""
         The bech32 encoded payload of the address.
         """
+    @property
+    def payload_bytes(self) -> bytes:
+        r"""
+        The raw payload bytes of the address (public key or script hash).
+        """
     def __eq__(self, other: builtins.object) -> builtins.bool: ...
     def __new__(cls, address: builtins.str) -> Address:
         r"""
@@ -777,6 +782,14 @@ class Hash:
         Raises:
             Exception: If the hex string is invalid.
         """
+    @staticmethod
+    def zero() -> Hash:
+        r"""
+        Create the all-zero hash, without parsing a hex string.
+        
+        Returns:
+            Hash: The 32-byte zero hash.
+        """
     def to_string(self) -> builtins.str:
         r"""
         Convert the hash to a hex string.
@@ -833,6 +846,11 @@ class Keypair:
         r"""
         The private key as hex.
         """
+    @property
+    def private_key_bytes(self) -> bytes:
+        r"""
+        The private key as raw bytes (32 bytes).
+        """
     def __new__(cls, secret_key: builtins.str, public_key: builtins.str, xonly_public_key: builtins.str) -> Keypair:
         r"""
         Create a keypair from hex string representations.
@@ -877,6 +895,20 @@ class Keypair:
             Keypair: A new random Keypair.
         """
     @staticmethod
+    def random_batch(n: builtins.int) -> builtins.list[Keypair]:
+        r"""
+        Generate a batch of random keypairs.
+        
+        Equivalent to calling `random()` `n` times, but shares a single
+        RNG handle across the batch and releases the GIL while generating.
+        
+        Args:
+            n: The number of keypairs to generate.
+        
+        Returns:
+            list[Keypair]: `n` new random Keypairs.
+        """
+    @staticmethod
     def from_private_key(private_key: PrivateKey) -> Keypair:
         r"""
         Create a keypair from a private key.
@@ -980,6 +1012,20 @@ class Mnemonic:
             The same mnemonic with different passwords produces
             completely different seeds (and thus different wallets).
         """
+    def to_seed_many(self, passwords: typing.Sequence[builtins.str]) -> builtins.list[builtins.str]:
+        r"""
+        Convert the mnemonic to seeds for several passwords at once.
+        
+        Equivalent to calling `to_seed()` once per password, but runs the
+        whole batch of PBKDF2 derivations in a single call with the GIL
+        released.
+        
+        Args:
+            passwords: The passphrases to derive seeds for.
+        
+        Returns:
+            list[str]: The seeds as hex strings, in the order of `passwords`.
+        """
 
 @typing.final
 class NetworkId:
@@ -1334,6 +1380,20 @@ class PrivateKey:
         Raises:
             Exception: If the hex string is invalid.
         """
+    @staticmethod
+    def from_bytes(data: bytes) -> PrivateKey:
+        r"""
+        Create a private key from raw bytes.
+        
+        Args:
+            data: The 32-byte secret key.
+        
+        Returns:
+            PrivateKey: A new PrivateKey instance.
+        
+        Raises:
+            Exception: If the bytes are not a valid secret key.
+        """
     def to_string(self) -> builtins.str:
         r"""
         Convert to hex string representation.
@@ -1421,6 +1481,19 @@ class PrivateKeyGenerator:
         Returns:
             PrivateKey: The private key at that index.
         
+        Raises:
+            Exception: If derivation fails.
+        """
+    def receive_keys(self, indices: typing.Sequence[builtins.int]) -> builtins.list[PrivateKey]:
+        r"""
+        Get receive (external) private keys at the given indices.
+        
+        Args:
+            indices: The address indices.
+        
+        Returns:
+            list[PrivateKey]: The private keys, in the order of `indices`.
+        
         Raises:
             Exception: If derivation fails.
         """
@@ -1534,6 +1607,21 @@ class PublicKey:
         Raises:
             Exception: If the hex string is invalid.
         """
+    @staticmethod
+    def from_bytes(data: bytes) -> PublicKey:
+        r"""
+        Create a public key from raw bytes.
+        
+        Args:
+            data: The public key as compressed (33 bytes), uncompressed (65 bytes),
+                or x-only (32 bytes) bytes.
+        
+        Returns:
+            PublicKey: A new PublicKey instance.
+        
+        Raises:
+            Exception: If the bytes are not a valid public key.
+        """
     def to_string(self) -> builtins.str:
         r"""
         Convert to hex string representation.
@@ -2480,6 +2568,10 @@ class Transaction:
     def id(self) -> builtins.str:
         r"""
         The transaction ID (hash) as a hex string.
+        
+        The ID is stored on the transaction when it is created and by
+        `finalize()`; reading it does not rehash. Call `finalize()` after
+        modifying the transaction to update it.
         """
     @property
     def inputs(self) -> builtins.list[TransactionInput]:
@@ -5179,6 +5271,30 @@ def compute_sighash(tx: Transaction, input_index: builtins.int, sighash_type: st
             inputs are missing UTXO entries.
     """
 
+def compute_sighashes(tx: Transaction, input_indices: typing.Optional[typing.Sequence[builtins.int]] = None, sighash_type: str | SighashType | None = SighashType.All, ecdsa: builtins.bool = False) -> builtins.list[Hash]:
+    r"""
+    Compute the signature hashes (sighashes) for several transaction inputs.
+    
+    Equivalent to calling `compute_sighash` for each input, but the
+    transaction-wide parts of the digest (previous outpoints, sequences,
+    sig op counts and outputs hashes) are computed once and reused for
+    every input.
+    
+    Args:
+        tx: The transaction containing the inputs.
+        input_indices: The indices of the inputs to compute sighashes for
+            (default: every input, in order).
+        sighash_type: The signature hash type (default: All).
+        ecdsa: Compute the ECDSA variant of the sighashes instead of Schnorr.
+    
+    Returns:
+        list[Hash]: The signature hashes, in the order of `input_indices`.
+    
+    Raises:
+        Exception: If an input index is out of bounds or the transaction's
+            inputs are missing UTXO entries.
+    """
+
 def covenant_id(outpoint: TransactionOutpoint, auth_outputs: typing.Sequence[TransactionOutput]) -> Hash:
     r"""
     Compute the covenant id for a set of authorizing outputs.
@@ -5339,6 +5455,17 @@ def kaspa_to_sompi(kaspa: builtins.float) -> builtins.int:
         int: The amount in sompi.
     """
 
+def kaspa_to_sompi_many(kaspa: typing.Sequence[builtins.float]) -> builtins.list[builtins.int]:
+    r"""
+    Convert several KAS amounts to sompi in a single call.
+    
+    Args:
+        kaspa: The amounts in KAS (any sequence of floats).
+    
+    Returns:
+        list[int]: The amounts in sompi, in input order.
+    """
+
 def maximum_standard_transaction_mass() -> builtins.int:
     r"""
     Get the maximum allowed mass for a standard transaction.
@@ -5474,6 +5601,17 @@ def sompi_to_kaspa(sompi: builtins.int) -> builtins.float:
         float: The amount in KAS.
     """
 
+def sompi_to_kaspa_many(sompi: typing.Sequence[builtins.int]) -> builtins.list[builtins.float]:
+    r"""
+    Convert several sompi amounts to KAS in a single call.
+    
+    Args:
+        sompi: The amounts in sompi (any sequence of ints).
+    
+    Returns:
+        list[float]: The amounts in KAS, in input order.
+    """
+
 def sompi_to_kaspa_string_with_suffix(sompi: builtins.int, network: str | NetworkType) -> builtins.str:
     r"""
     Convert sompi to a formatted KAS string with network suffix.
@@ -5518,6 +5656,20 @@ def verify_message(message: builtins.str, signature: builtins.str, public_key: P
         Exception: If the signature format is invalid.
     """
 
+def verify_messages(messages: typing.Sequence[tuple[builtins.str, builtins.str, PublicKey]]) -> builtins.list[builtins.bool]:
+    r"""
+    Verify several message signatures in a single call.
+    
+    Args:
+        messages: A list of (message, signature, public_key) tuples.
+    
+    Returns:
+        list[bool]: For each tuple, True if the signature is valid, in input order.
+    
+    Raises:
+        Exception: If any signature format is invalid.
+    """
+
 # =============================================================================
 # RPC Types (from kaspa_rpc.pyi)
 # =============================================================================
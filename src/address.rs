@@ -1,7 +1,11 @@
 use std::str::FromStr;
 
 use kaspa_addresses::{Address, AddressError, Prefix, Version};
-use pyo3::{exceptions::PyException, prelude::*};
+use pyo3::{
+    exceptions::PyException,
+    prelude::*,
+    types::{PyBytes, PyString},
+};
 use pyo3_stub_gen::derive::*;
 
 crate::wrap_unit_enum_for_py!(
@@ -133,6 +137,12 @@ impl PyAddress {
         self.0.payload_to_string()
     }
 
+    /// The raw payload bytes of the address (public key or script hash).
+    #[getter]
+    pub fn get_payload_bytes<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        PyBytes::new(py, &self.0.payload)
+    }
+
     /// Get a shortened representation of the address.
     ///
     /// Args:
@@ -179,24 +189,34 @@ impl From<PyAddress> for Address {
     }
 }
 
-impl TryFrom<String> for PyAddress {
+impl TryFrom<&str> for PyAddress {
     type Error = PyErr;
 
-    fn try_from(value: String) -> Result<Self, Self::Error> {
+    fn try_from(value: &str) -> Result<Self, Self::Error> {
         let inner =
             Address::try_from(value).map_err(|err| PyException::new_err(err.to_string()))?;
         Ok(PyAddress(inner))
     }
 }
 
+impl TryFrom<String> for PyAddress {
+    type Error = PyErr;
+
+    fn try_from(value: String) -> Result<Self, Self::Error> {
+        PyAddress::try_from(value.as_str())
+    }
+}
+
 impl<'py> FromPyObject<'_, 'py> for PyAddress {
     type Error = PyErr;
 
     fn extract(obj: Borrowed<'_, '_, PyAny>) -> Result<Self, Self::Error> {
         if let Ok(address) = obj.cast::<PyAddress>() {
             Ok(address.borrow().clone())
-        } else if let Ok(address) = obj.extract::<String>() {
-            Ok(PyAddress::try_from(address)?)
+        } else if let Ok(address) = obj.cast::<PyString>() {
+            // Parse straight from the borrowed UTF-8 buffer rather than
+            // copying into an owned `String` first.
+            PyAddress::try_from(address.to_str()?)
         } else {
             Err(PyException::new_err(
                 "address must be an `Address` instance or `str`",
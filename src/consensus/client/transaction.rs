@@ -62,6 +62,10 @@ impl PyTransaction {
     }
 
     /// The transaction ID (hash) as a hex string.
+    ///
+    /// The ID is stored on the transaction when it is created and by
+    /// `finalize()`; reading it does not rehash. Call `finalize()` after
+    /// modifying the transaction to update it.
     #[getter]
     pub fn get_id(&self) -> String {
         self.0.inner().id.to_string()
@@ -123,8 +127,8 @@ impl PyTransaction {
             .0
             .inner()
             .inputs
-            .clone()
-            .into_iter()
+            .iter()
+            .cloned()
             .map(PyTransactionInput::from)
             .collect())
     }
@@ -173,8 +177,8 @@ impl PyTransaction {
             .0
             .inner()
             .outputs
-            .clone()
-            .into_iter()
+            .iter()
+            .cloned()
             .map(PyTransactionOutput::from)
             .collect())
     }
@@ -380,10 +384,12 @@ impl PyTransaction {
 
     // Cannot be derived via pyclass(eq) as wrapped Transaction type does not derive PartialEq/Eq
     fn __eq__(&self, other: &PyTransaction) -> bool {
-        match (bincode::serialize(&self.0), bincode::serialize(&other.0)) {
-            (Ok(a), Ok(b)) => a == b,
-            _ => false,
-        }
+        let Ok(expected) = bincode::serialize(&self.0) else {
+            return false;
+        };
+        // Stream `other` against `self`'s encoding rather than serializing it too
+        let mut writer = MatchWriter(&expected);
+        bincode::serialize_into(&mut writer, &other.0).is_ok() && writer.0.is_empty()
     }
 
     /// The detailed string representation.
@@ -403,6 +409,26 @@ impl PyTransaction {
     }
 }
 
+/// `io::Write` sink that checks written bytes against an expected encoding,
+/// failing on the first mismatch.
+struct MatchWriter<'a>(&'a [u8]);
+
+impl std::io::Write for MatchWriter<'_> {
+    fn write(&mut self, buf: &[u8]) -> std::io::Result<usize> {
+        match self.0.strip_prefix(buf) {
+            Some(rest) => {
+                self.0 = rest;
+                Ok(buf.len())
+            }
+            None => Err(std::io::ErrorKind::InvalidData.into()),
+        }
+    }
+
+    fn flush(&mut self) -> std::io::Result<()> {
+        Ok(())
+    }
+}
+
 impl From<Transaction> for PyTransaction {
     fn from(value: Transaction) -> Self {
         PyTransaction(value)
@@ -5,10 +5,22 @@ use crate::{
 };
 use kaspa_consensus_core::network::NetworkType;
 use kaspa_txscript::{script_class::ScriptClass, standard};
-use pyo3::{exceptions::PyException, prelude::*};
+use pyo3::{
+    exceptions::PyException,
+    prelude::*,
+    types::{PyBytes, PyString},
+};
 use pyo3_stub_gen::derive::gen_stub_pyfunction;
 use workflow_core::hex::ToHex;
 
+// Byte lengths of the standard script classes:
+// P2PK:       OpData32 <x-only pubkey> OpCheckSig
+// P2PK-ECDSA: OpData33 <compressed pubkey> OpCheckSigECDSA
+// P2SH:       OpBlake2b OpData32 <script hash> OpEqual
+const PAY_TO_PUBKEY_LEN: usize = 34;
+const PAY_TO_PUBKEY_ECDSA_LEN: usize = 35;
+const PAY_TO_SCRIPT_HASH_LEN: usize = 35;
+
 /// Create a pay-to-address locking script.
 ///
 /// Args:
@@ -97,8 +109,10 @@ pub fn py_address_from_script_public_key(
 #[gen_stub_pyfunction]
 #[pyfunction]
 #[pyo3(name = "is_script_pay_to_pubkey")]
-pub fn py_is_script_pay_to_pubkey(script: PyBinary) -> PyResult<bool> {
-    Ok(ScriptClass::is_pay_to_pubkey(script.data.as_slice()))
+pub fn py_is_script_pay_to_pubkey(
+    #[gen_stub(override_type(type_repr = "Binary"))] script: &Bound<'_, PyAny>,
+) -> PyResult<bool> {
+    is_script_class::<PAY_TO_PUBKEY_LEN>(script, ScriptClass::is_pay_to_pubkey)
 }
 
 /// Check if a script is a pay-to-pubkey-ECDSA script.
@@ -111,8 +125,10 @@ pub fn py_is_script_pay_to_pubkey(script: PyBinary) -> PyResult<bool> {
 #[gen_stub_pyfunction]
 #[pyfunction]
 #[pyo3(name = "is_script_pay_to_pubkey_ecdsa")]
-pub fn py_is_script_pay_to_pubkey_ecdsa(script: PyBinary) -> PyResult<bool> {
-    Ok(ScriptClass::is_pay_to_pubkey_ecdsa(script.data.as_slice()))
+pub fn py_is_script_pay_to_pubkey_ecdsa(
+    #[gen_stub(override_type(type_repr = "Binary"))] script: &Bound<'_, PyAny>,
+) -> PyResult<bool> {
+    is_script_class::<PAY_TO_PUBKEY_ECDSA_LEN>(script, ScriptClass::is_pay_to_pubkey_ecdsa)
 }
 
 /// Check if a script is a pay-to-script-hash (P2SH) script.
@@ -125,6 +141,36 @@ pub fn py_is_script_pay_to_pubkey_ecdsa(script: PyBinary) -> PyResult<bool> {
 #[gen_stub_pyfunction]
 #[pyfunction]
 #[pyo3(name = "is_script_pay_to_script_hash")]
-pub fn py_is_script_pay_to_script_hash(script: PyBinary) -> PyResult<bool> {
-    Ok(ScriptClass::is_pay_to_script_hash(script.data.as_slice()))
+pub fn py_is_script_pay_to_script_hash(
+    #[gen_stub(override_type(type_repr = "Binary"))] script: &Bound<'_, PyAny>,
+) -> PyResult<bool> {
+    is_script_class::<PAY_TO_SCRIPT_HASH_LEN>(script, ScriptClass::is_pay_to_script_hash)
+}
+
+// Apply a script class predicate to a `Binary` argument of script length `N`.
+// `bytes` are checked in place. A hex `str` of the matching length is decoded
+// once into a stack buffer; any other length is only scanned, so invalid hex
+// still raises, before returning False.
+fn is_script_class<const N: usize>(
+    script: &Bound<'_, PyAny>,
+    predicate: fn(&[u8]) -> bool,
+) -> PyResult<bool> {
+    if let Ok(bytes) = script.cast::<PyBytes>() {
+        return Ok(predicate(bytes.as_bytes()));
+    }
+    if let Ok(hex) = script.cast::<PyString>() {
+        let hex = hex.to_str()?.as_bytes();
+        if hex.len() == N * 2 {
+            let mut data = [0u8; N];
+            faster_hex::hex_decode(hex, &mut data)
+                .map_err(|_| PyException::new_err("Invalid hex string"))?;
+            return Ok(predicate(&data));
+        }
+        if !hex.len().is_multiple_of(2) || !hex.iter().all(u8::is_ascii_hexdigit) {
+            return Err(PyException::new_err("Invalid hex string"));
+        }
+        return Ok(false);
+    }
+    let script: PyBinary = script.extract()?;
+    Ok(predicate(script.data.as_slice()))
 }
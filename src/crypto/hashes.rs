@@ -1,4 +1,4 @@
-use kaspa_hashes::Hash;
+use kaspa_hashes::{Hash, ZERO_HASH};
 use pyo3::{exceptions::PyException, prelude::*, types::PyBytes};
 use pyo3_stub_gen::derive::*;
 use std::str::FromStr;
@@ -31,6 +31,15 @@ impl PyHash {
         Ok(Self(inner))
     }
 
+    /// Create the all-zero hash, without parsing a hex string.
+    ///
+    /// Returns:
+    ///     Hash: The 32-byte zero hash.
+    #[staticmethod]
+    pub fn zero() -> Self {
+        Self(ZERO_HASH)
+    }
+
     /// Convert the hash to a hex string.
     ///
     /// Returns:
@@ -3,8 +3,14 @@ use crate::{
     types::PyBinary,
 };
 use kaspa_consensus_core::mass::ScriptUnits;
-use kaspa_txscript::{EngineFlags, script_builder as native, standard};
-use pyo3::{exceptions::PyException, prelude::*};
+use kaspa_txscript::{
+    EngineFlags, opcodes::codes::OpPushData1, script_builder as native, standard,
+};
+use pyo3::{
+    exceptions::PyException,
+    prelude::*,
+    types::{PyBytes, PyString},
+};
 use pyo3_stub_gen::derive::{gen_stub_pyclass, gen_stub_pymethods};
 use std::sync::{Arc, Mutex, MutexGuard};
 use workflow_core::hex::ToHex;
@@ -26,6 +32,39 @@ impl PyScriptBuilder {
     }
 }
 
+// Run `f` over a `Binary` argument, borrowing `bytes` in place instead of
+// copying them into a `PyBinary`.
+fn with_binary<R>(data: &Bound<'_, PyAny>, f: impl FnOnce(&[u8]) -> PyResult<R>) -> PyResult<R> {
+    if let Ok(bytes) = data.cast::<PyBytes>() {
+        f(bytes.as_bytes())
+    } else {
+        let data: PyBinary = data.extract()?;
+        f(data.as_ref())
+    }
+}
+
+// Canonical push size of hex-encoded data, computed from its length. Only a
+// single byte needs decoding, as it may be pushed as a small-integer opcode.
+fn canonical_hex_data_size(hex: &[u8]) -> PyResult<usize> {
+    if !hex.len().is_multiple_of(2) || !hex.iter().all(u8::is_ascii_hexdigit) {
+        return Err(PyException::new_err("Invalid hex string"));
+    }
+    let size = match hex.len() / 2 {
+        1 => {
+            let mut byte = [0u8; 1];
+            faster_hex::hex_decode(hex, &mut byte)
+                .map_err(|_| PyException::new_err("Invalid hex string"))?;
+            native::ScriptBuilder::canonical_data_size(&byte)
+        }
+        0 => 1,
+        len if len < OpPushData1 as usize => len + 1,
+        len if len <= 0xff => len + 2,
+        len if len <= 0xffff => len + 3,
+        len => len + 5,
+    };
+    Ok(size)
+}
+
 impl Default for PyScriptBuilder {
     fn default() -> Self {
         Self(Arc::new(Mutex::new(native::ScriptBuilder::new())))
@@ -157,11 +196,15 @@ impl PyScriptBuilder {
     ///
     /// Raises:
     ///     Exception: If the data cannot be added.
-    pub fn add_data(&self, data: PyBinary) -> PyResult<Self> {
-        let mut inner = self.inner();
-        inner
-            .add_data(data.as_ref())
-            .map_err(|err| PyException::new_err(format!("{}", err)))?;
+    pub fn add_data(
+        &self,
+        #[gen_stub(override_type(type_repr = "Binary"))] data: &Bound<'_, PyAny>,
+    ) -> PyResult<Self> {
+        with_binary(data, |data| {
+            self.inner()
+                .add_data(data)
+                .map_err(|err| PyException::new_err(format!("{}", err)))
+        })?;
 
         Ok(self.clone())
     }
@@ -231,10 +274,18 @@ impl PyScriptBuilder {
     /// Returns:
     ///     int: The size in bytes including push opcodes.
     #[staticmethod]
-    pub fn canonical_data_size(data: PyBinary) -> PyResult<u32> {
-        let size = native::ScriptBuilder::canonical_data_size(data.as_ref()) as u32;
-
-        Ok(size)
+    pub fn canonical_data_size(
+        #[gen_stub(override_type(type_repr = "Binary"))] data: &Bound<'_, PyAny>,
+    ) -> PyResult<u32> {
+        let size = if let Ok(hex) = data.cast::<PyString>() {
+            canonical_hex_data_size(hex.to_str()?.as_bytes())?
+        } else {
+            with_binary(data, |data| {
+                Ok(native::ScriptBuilder::canonical_data_size(data))
+            })?
+        };
+
+        Ok(size as u32)
     }
 
     /// Get the script as a hex string.
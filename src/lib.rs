@@ -101,13 +101,25 @@ fn kaspa(py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
         wallet::core::tx::signer::py_compute_sighash,
         m
     )?)?;
+    m.add_function(wrap_pyfunction!(
+        wallet::core::tx::signer::py_compute_sighashes,
+        m
+    )?)?;
     m.add_function(wrap_pyfunction!(
         wallet::core::tx::signer::py_sign_script_hash,
         m
     )?)?;
 
     m.add_function(wrap_pyfunction!(wallet::core::utils::py_kaspa_to_sompi, m)?)?;
+    m.add_function(wrap_pyfunction!(
+        wallet::core::utils::py_kaspa_to_sompi_many,
+        m
+    )?)?;
     m.add_function(wrap_pyfunction!(wallet::core::utils::py_sompi_to_kaspa, m)?)?;
+    m.add_function(wrap_pyfunction!(
+        wallet::core::utils::py_sompi_to_kaspa_many,
+        m
+    )?)?;
     m.add_function(wrap_pyfunction!(
         wallet::core::utils::py_sompi_to_kaspa_string_with_suffix,
         m
@@ -185,6 +197,10 @@ fn kaspa(py: Python, m: &Bound<'_, PyModule>) -> PyResult<()> {
         wallet::core::message::py_verify_message,
         m
     )?)?;
+    m.add_function(wrap_pyfunction!(
+        wallet::core::message::py_verify_messages,
+        m
+    )?)?;
     m.add_class::<wallet::core::events::PyWalletEventType>()?;
     m.add_class::<wallet::core::api::message::PyAccountsDiscoveryKind>()?;
     m.add_class::<wallet::core::api::message::PyCommitRevealAddressKind>()?;
@@ -12,11 +12,12 @@ impl FromStr for PyLanguage {
     type Err = PyErr;
 
     fn from_str(s: &str) -> Result<Self, Self::Err> {
-        match s.to_lowercase().as_str() {
-            "english" => Ok(PyLanguage::English),
-            _ => Err(PyException::new_err(
+        if s.eq_ignore_ascii_case("english") {
+            Ok(PyLanguage::English)
+        } else {
+            Err(PyException::new_err(
                 "Unsupported string value for Language",
-            )),
+            ))
         }
     }
 }
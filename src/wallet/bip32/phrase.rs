@@ -145,4 +145,24 @@ impl PyMnemonic {
         let password = password.unwrap_or_default();
         self.0.to_seed(password).as_bytes().to_vec().to_hex()
     }
+
+    /// Convert the mnemonic to seeds for several passwords at once.
+    ///
+    /// Equivalent to calling `to_seed()` once per password, but runs the
+    /// whole batch of PBKDF2 derivations in a single call with the GIL
+    /// released.
+    ///
+    /// Args:
+    ///     passwords: The passphrases to derive seeds for.
+    ///
+    /// Returns:
+    ///     list[str]: The seeds as hex strings, in the order of `passwords`.
+    pub fn to_seed_many(&self, py: Python<'_>, passwords: Vec<String>) -> Vec<String> {
+        py.detach(|| {
+            passwords
+                .iter()
+                .map(|password| self.0.to_seed(password).as_bytes().to_vec().to_hex())
+                .collect()
+        })
+    }
 }
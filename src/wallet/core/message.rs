@@ -56,15 +56,60 @@ pub fn py_verify_message(
     signature: String,
     public_key: PyPublicKey,
 ) -> PyResult<bool> {
-    let pm = PersonalMessage(&message);
+    verify_hex_signature(&message, &signature, &public_key)
+}
+
+/// Verify several message signatures in a single call.
+///
+/// Args:
+///     messages: A list of (message, signature, public_key) tuples.
+///
+/// Returns:
+///     list[bool]: For each tuple, True if the signature is valid, in input order.
+///
+/// Raises:
+///     Exception: If any signature format is invalid.
+#[gen_stub_pyfunction]
+#[pyfunction]
+#[pyo3(name = "verify_messages")]
+pub fn py_verify_messages(
+    py: Python<'_>,
+    messages: Vec<(String, String, PyPublicKey)>,
+) -> PyResult<Vec<bool>> {
+    py.detach(|| {
+        messages
+            .iter()
+            .map(|(message, signature, public_key)| {
+                verify_hex_signature(message, signature, public_key)
+            })
+            .collect()
+    })
+}
+
+// Decode a hex Schnorr signature and verify it against `message`.
+fn verify_hex_signature(
+    message: &str,
+    signature: &str,
+    public_key: &PyPublicKey,
+) -> PyResult<bool> {
     let mut signature_bytes = [0u8; 64];
     faster_hex::hex_decode(signature.as_bytes(), &mut signature_bytes)
         .map_err(|err| PyException::new_err(format!("{}", err)))?;
+    if !has_valid_nonce(&signature_bytes) {
+        return Ok(false);
+    }
 
     Ok(verify_message(
-        &pm,
+        &PersonalMessage(message),
         &signature_bytes.to_vec(),
         &public_key.0.xonly_public_key,
     )
     .is_ok())
 }
+
+// A Schnorr signature starts with the x-coordinate of its nonce point R.
+// If that is not on the curve the signature cannot verify, so it is
+// rejected without hashing the message.
+fn has_valid_nonce(signature: &[u8]) -> bool {
+    secp256k1::XOnlyPublicKey::from_slice(&signature[..32]).is_ok()
+}
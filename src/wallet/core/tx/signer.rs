@@ -9,7 +9,7 @@ use kaspa_consensus_core::{
         sighash::{
             SigHashReusedValuesUnsync, calc_ecdsa_signature_hash, calc_schnorr_signature_hash,
         },
-        sighash_type::SIG_HASH_ALL,
+        sighash_type::{SIG_HASH_ALL, SigHashType},
         wasm::SighashType,
     },
     sign::{sign_input, verify},
@@ -152,24 +152,80 @@ pub fn py_compute_sighash(
     let sighash_type: SighashType = sighash_type.unwrap_or(PySighashType::All).into();
     let reused_values = SigHashReusedValuesUnsync::new();
 
-    let hash = if ecdsa {
-        calc_ecdsa_signature_hash(
-            &populated_transaction,
-            input_index,
-            sighash_type.into(),
-            &reused_values,
-        )
-    } else {
-        calc_schnorr_signature_hash(
-            &populated_transaction,
-            input_index,
-            sighash_type.into(),
-            &reused_values,
-        )
-    };
+    let hash = calc_sighash(
+        &populated_transaction,
+        input_index,
+        sighash_type.into(),
+        ecdsa,
+        &reused_values,
+    );
     Ok(hash.into())
 }
 
+/// Compute the signature hashes (sighashes) for several transaction inputs.
+///
+/// Equivalent to calling `compute_sighash` for each input, but the
+/// transaction-wide parts of the digest (previous outpoints, sequences,
+/// sig op counts and outputs hashes) are computed once and reused for
+/// every input.
+///
+/// Args:
+///     tx: The transaction containing the inputs.
+///     input_indices: The indices of the inputs to compute sighashes for
+///         (default: every input, in order).
+///     sighash_type: The signature hash type (default: All).
+///     ecdsa: Compute the ECDSA variant of the sighashes instead of Schnorr.
+///
+/// Returns:
+///     list[Hash]: The signature hashes, in the order of `input_indices`.
+///
+/// Raises:
+///     Exception: If an input index is out of bounds or the transaction's
+///         inputs are missing UTXO entries.
+#[gen_stub_pyfunction]
+#[pyfunction]
+#[pyo3(name = "compute_sighashes")]
+#[pyo3(signature = (tx, input_indices=None, sighash_type=None, ecdsa=false))]
+pub fn py_compute_sighashes(
+    tx: &PyTransaction,
+    input_indices: Option<Vec<usize>>,
+    #[gen_stub(override_type(type_repr = "str | SighashType | None = SighashType.All"))]
+    sighash_type: Option<PySighashType>,
+    ecdsa: bool,
+) -> PyResult<Vec<PyHash>> {
+    let (cctx, utxos) = tx
+        .inner()
+        .tx_and_utxos()
+        .map_err(|err| PyException::new_err(err.to_string()))?;
+    let input_count = cctx.inputs.len();
+    let input_indices = input_indices.unwrap_or_else(|| (0..input_count).collect());
+    if let Some(input_index) = input_indices.iter().find(|&&index| index >= input_count) {
+        return Err(PyException::new_err(format!(
+            "Input index {input_index} out of bounds for transaction with {input_count} inputs"
+        )));
+    }
+    let populated_transaction = PopulatedTransaction::new(&cctx, utxos);
+
+    let sighash_type: SighashType = sighash_type.unwrap_or(PySighashType::All).into();
+    let sighash_type: SigHashType = sighash_type.into();
+    // Shared across inputs so the transaction-wide hashes are computed once
+    let reused_values = SigHashReusedValuesUnsync::new();
+
+    Ok(input_indices
+        .into_iter()
+        .map(|input_index| {
+            calc_sighash(
+                &populated_transaction,
+                input_index,
+                sighash_type,
+                ecdsa,
+                &reused_values,
+            )
+            .into()
+        })
+        .collect())
+}
+
 /// Sign a script hash with a private key.
 ///
 /// Args:
@@ -193,6 +249,20 @@ pub fn py_sign_script_hash(script_hash: String, privkey: &PyPrivateKey) -> PyRes
     Ok(result.to_hex())
 }
 
+fn calc_sighash(
+    tx: &PopulatedTransaction,
+    input_index: usize,
+    sighash_type: SigHashType,
+    ecdsa: bool,
+    reused_values: &SigHashReusedValuesUnsync,
+) -> Hash {
+    if ecdsa {
+        calc_ecdsa_signature_hash(tx, input_index, sighash_type, reused_values)
+    } else {
+        calc_schnorr_signature_hash(tx, input_index, sighash_type, reused_values)
+    }
+}
+
 fn sign_transaction<'a>(
     tx: &'a Transaction,
     private_keys: &[[u8; 32]],
@@ -17,6 +17,23 @@ pub fn py_kaspa_to_sompi(kaspa: f64) -> u64 {
     kaspa_wallet_core::utils::kaspa_to_sompi(kaspa)
 }
 
+/// Convert several KAS amounts to sompi in a single call.
+///
+/// Args:
+///     kaspa: The amounts in KAS (any sequence of floats).
+///
+/// Returns:
+///     list[int]: The amounts in sompi, in input order.
+#[gen_stub_pyfunction]
+#[pyfunction]
+#[pyo3(name = "kaspa_to_sompi_many")]
+pub fn py_kaspa_to_sompi_many(kaspa: Vec<f64>) -> Vec<u64> {
+    kaspa
+        .into_iter()
+        .map(kaspa_wallet_core::utils::kaspa_to_sompi)
+        .collect()
+}
+
 /// Convert sompi to KAS (1 KAS = 100,000,000 sompi).
 ///
 /// Args:
@@ -31,6 +48,23 @@ pub fn py_sompi_to_kaspa(sompi: u64) -> f64 {
     kaspa_wallet_core::utils::sompi_to_kaspa(sompi)
 }
 
+/// Convert several sompi amounts to KAS in a single call.
+///
+/// Args:
+///     sompi: The amounts in sompi (any sequence of ints).
+///
+/// Returns:
+///     list[float]: The amounts in KAS, in input order.
+#[gen_stub_pyfunction]
+#[pyfunction]
+#[pyo3(name = "sompi_to_kaspa_many")]
+pub fn py_sompi_to_kaspa_many(sompi: Vec<u64>) -> Vec<f64> {
+    sompi
+        .into_iter()
+        .map(kaspa_wallet_core::utils::sompi_to_kaspa)
+        .collect()
+}
+
 /// Convert sompi to a formatted KAS string with network suffix.
 ///
 /// Args:
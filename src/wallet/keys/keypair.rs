@@ -3,7 +3,7 @@ use crate::{address::PyAddress, consensus::core::network::PyNetworkType};
 use kaspa_addresses::{Address, Version};
 use kaspa_consensus_core::network::NetworkType;
 use kaspa_wallet_keys::{privatekey::PrivateKey, publickey::PublicKey};
-use pyo3::{exceptions::PyException, prelude::*};
+use pyo3::{exceptions::PyException, prelude::*, types::PyBytes};
 use pyo3_stub_gen::derive::{gen_stub_pyclass, gen_stub_pymethods};
 use std::str::FromStr;
 use zeroize::Zeroize;
@@ -69,6 +69,15 @@ impl PyKeypair {
         PrivateKey::from(&self.secret_key).to_hex()
     }
 
+    /// The private key as raw bytes (32 bytes).
+    #[getter]
+    pub fn get_private_key_bytes<'py>(&self, py: Python<'py>) -> Bound<'py, PyBytes> {
+        let mut key_bytes = self.secret_key.secret_bytes();
+        let bytes = PyBytes::new(py, &key_bytes);
+        key_bytes.zeroize();
+        bytes
+    }
+
     /// Derive a Schnorr address from this keypair.
     ///
     /// Args:
@@ -112,8 +121,8 @@ impl PyKeypair {
     #[staticmethod]
     #[pyo3(name = "random")]
     pub fn random() -> PyResult<PyKeypair> {
-        let secp = secp256k1::Secp256k1::new();
-        let (secret_key, public_key) = secp.generate_keypair(&mut rand::thread_rng());
+        let (secret_key, public_key) =
+            secp256k1::SECP256K1.generate_keypair(&mut rand::thread_rng());
         let (xonly_public_key, _) = public_key.x_only_public_key();
         Ok(PyKeypair {
             secret_key,
@@ -122,6 +131,36 @@ impl PyKeypair {
         })
     }
 
+    /// Generate a batch of random keypairs.
+    ///
+    /// Equivalent to calling `random()` `n` times, but shares a single
+    /// RNG handle across the batch and releases the GIL while generating.
+    ///
+    /// Args:
+    ///     n: The number of keypairs to generate.
+    ///
+    /// Returns:
+    ///     list[Keypair]: `n` new random Keypairs.
+    #[staticmethod]
+    #[pyo3(name = "random_batch")]
+    pub fn random_batch(py: Python<'_>, n: usize) -> PyResult<Vec<PyKeypair>> {
+        let keypairs = py.detach(|| {
+            let mut rng = rand::thread_rng();
+            (0..n)
+                .map(|_| {
+                    let (secret_key, public_key) = secp256k1::SECP256K1.generate_keypair(&mut rng);
+                    let (xonly_public_key, _) = public_key.x_only_public_key();
+                    PyKeypair {
+                        secret_key,
+                        public_key,
+                        xonly_public_key,
+                    }
+                })
+                .collect()
+        });
+        Ok(keypairs)
+    }
+
     /// Create a keypair from a private key.
     ///
     /// Args:
@@ -135,12 +174,11 @@ impl PyKeypair {
     #[staticmethod]
     #[pyo3(name = "from_private_key")]
     pub fn from_private_key(private_key: &PyPrivateKey) -> PyResult<PyKeypair> {
-        let secp = secp256k1::Secp256k1::new();
         let mut key_bytes = private_key.secret_bytes();
         let secret_key = secp256k1::SecretKey::from_slice(&key_bytes)
             .map_err(|e| PyException::new_err(format!("{e}")))?;
         key_bytes.zeroize();
-        let public_key = secp256k1::PublicKey::from_secret_key(&secp, &secret_key);
+        let public_key = secp256k1::PublicKey::from_secret_key(secp256k1::SECP256K1, &secret_key);
         let (xonly_public_key, _) = public_key.x_only_public_key();
         Ok(PyKeypair {
             secret_key,
@@ -49,6 +49,24 @@ impl PyPrivateKey {
         Ok(PyPrivateKey(private_key))
     }
 
+    /// Create a private key from raw bytes.
+    ///
+    /// Args:
+    ///     data: The 32-byte secret key.
+    ///
+    /// Returns:
+    ///     PrivateKey: A new PrivateKey instance.
+    ///
+    /// Raises:
+    ///     Exception: If the bytes are not a valid secret key.
+    #[staticmethod]
+    #[pyo3(name = "from_bytes")]
+    pub fn from_bytes(data: &[u8]) -> PyResult<PyPrivateKey> {
+        let secret_key = secp256k1::SecretKey::from_slice(data)
+            .map_err(|err| PyException::new_err(err.to_string()))?;
+        Ok(PyPrivateKey(PrivateKey::from(&secret_key)))
+    }
+
     /// Convert to hex string representation.
     ///
     /// Returns:
@@ -92,8 +110,8 @@ impl PyPrivateKey {
             .0
             .to_public_key()
             .map_err(|_| PyException::new_err("Failed to derive public key"))?;
-        let (x_only_public_key, _) = public_key.public_key.unwrap().x_only_public_key();
-        let payload = x_only_public_key.serialize();
+        // The x-only key is already derived alongside the full public key
+        let payload = public_key.xonly_public_key.serialize();
         let address = Address::new(NetworkType::from(network).into(), Version::PubKey, &payload);
         Ok(address.into())
     }
@@ -99,6 +99,23 @@ impl PyPrivateKeyGenerator {
         Ok(PyPrivateKey::new(inner))
     }
 
+    /// Get receive (external) private keys at the given indices.
+    ///
+    /// Args:
+    ///     indices: The address indices.
+    ///
+    /// Returns:
+    ///     list[PrivateKey]: The private keys, in the order of `indices`.
+    ///
+    /// Raises:
+    ///     Exception: If derivation fails.
+    pub fn receive_keys(&self, indices: Vec<u32>) -> PyResult<Vec<PyPrivateKey>> {
+        indices
+            .into_iter()
+            .map(|index| self.receive_key(index))
+            .collect()
+    }
+
     /// Get a change (internal) private key at the given index.
     ///
     /// Args:
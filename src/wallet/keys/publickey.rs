@@ -33,6 +33,29 @@ impl PyPublicKey {
         Ok(PyPublicKey(public_key))
     }
 
+    /// Create a public key from raw bytes.
+    ///
+    /// Args:
+    ///     data: The public key as compressed (33 bytes), uncompressed (65 bytes),
+    ///         or x-only (32 bytes) bytes.
+    ///
+    /// Returns:
+    ///     PublicKey: A new PublicKey instance.
+    ///
+    /// Raises:
+    ///     Exception: If the bytes are not a valid public key.
+    #[staticmethod]
+    #[pyo3(name = "from_bytes")]
+    pub fn from_bytes(data: &[u8]) -> PyResult<PyPublicKey> {
+        let public_key = match secp256k1::PublicKey::from_slice(data) {
+            Ok(public_key) => PublicKey::from(&public_key),
+            Err(_) => secp256k1::XOnlyPublicKey::from_slice(data)
+                .map(PublicKey::from)
+                .map_err(|err| PyException::new_err(err.to_string()))?,
+        };
+        Ok(PyPublicKey(public_key))
+    }
+
     /// Convert to hex string representation.
     ///
     /// Returns:
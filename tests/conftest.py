@@ -2,6 +2,7 @@
 Shared fixtures for Kaspa Python SDK tests.
 """
 
+import functools
 import os
 import shutil
 import uuid
@@ -15,10 +16,15 @@ from kaspa import (
     PublicKey,
     Keypair,
     XPrv,
+    PublicKeyGenerator,
+    PrivateKeyGenerator,
+    ScriptBuilder,
+    Opcodes,
     Address,
     RpcClient,
     Resolver,
     Wallet,
+    sign_message,
 )
 
 
@@ -50,6 +56,10 @@ TEST_PUBLIC_KEY_HEX = "dff1d77f2a671c5f36183726db2341be58feae1da2deced843240f7b5
 
 TEST_COMPRESSED_PUBLIC_KEY_HEX = "02dff1d77f2a671c5f36183726db2341be58feae1da2deced843240f7b502ba659"
 
+TEST_PRIVATE_KEY_BYTES = bytes.fromhex(TEST_PRIVATE_KEY_HEX)
+
+TEST_PUBLIC_KEY_BYTES = bytes.fromhex(TEST_PUBLIC_KEY_HEX)
+
 TEST_MASTER_XPRV = (
     "kprv5y2qurMHCsXYrNfU3GCihuwG3vMqFji7PZXajMEqyBkNh9UZUJgoHYBLTKu1eM4MvUtomcXPQ3Sw9HZ5ebbM4byoUciHo1zrPJBQfqpLorQ"
 )
@@ -62,7 +72,7 @@ TEST_MAINNET_ADDRESS = "kaspa:qqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqqq
 # Mnemonic Fixtures
 # =============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def known_mnemonic() -> Mnemonic:
     """Return a Mnemonic object from the known test phrase."""
     return Mnemonic(phrase=TEST_MNEMONIC_PHRASE)
@@ -71,25 +81,42 @@ def known_mnemonic() -> Mnemonic:
 # =============================================================================
 # Key Fixtures
 # =============================================================================
+# Key and mnemonic objects are never mutated by tests, so they are built once
+# per session rather than re-deriving (scalar mults, PBKDF2) for every test.
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def known_private_key() -> PrivateKey:
-    """Return a PrivateKey object from the known test hex."""
-    return PrivateKey(TEST_PRIVATE_KEY_HEX)
+    """Return a PrivateKey object from the known test key bytes."""
+    return PrivateKey.from_bytes(TEST_PRIVATE_KEY_BYTES)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def known_public_key() -> PublicKey:
-    """Return a PublicKey object from the known test hex."""
-    return PublicKey(TEST_PUBLIC_KEY_HEX)
+    """Return a PublicKey object from the known test key bytes."""
+    return PublicKey.from_bytes(TEST_PUBLIC_KEY_BYTES)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def known_ecdsa_public_key() -> PublicKey:
+    """Return a PublicKey object from the known compressed (33-byte) test hex."""
+    return PublicKey(TEST_COMPRESSED_PUBLIC_KEY_HEX)
+
+
+@pytest.fixture(scope="session")
 def known_keypair(known_private_key) -> Keypair:
     """Return a Keypair derived from the known private key."""
     return known_private_key.to_keypair()
 
 
+@pytest.fixture(scope="session")
+def known_addresses(known_private_key) -> dict[str, Address]:
+    """Return the Schnorr addresses of the known private key, keyed by network."""
+    return {
+        network: known_private_key.to_address(network)
+        for network in ("mainnet", "testnet")
+    }
+
+
 # =============================================================================
 # XPrv/XPub Fixtures
 # =============================================================================
@@ -101,6 +128,42 @@ def known_xprv_from_mnemonic(known_mnemonic) -> XPrv:
     return XPrv(seed)
 
 
+@pytest.fixture(scope="session")
+def multisig_keys_3() -> tuple[PublicKey, PublicKey, PublicKey]:
+    """Return three distinct PublicKeys for multisig tests."""
+    return tuple(PrivateKey(c * 64).to_public_key() for c in "123")
+
+
+@pytest.fixture(scope="session")
+def multisig_keys_2(multisig_keys_3) -> tuple[PublicKey, PublicKey]:
+    """Return the first two multisig test PublicKeys."""
+    return multisig_keys_3[:2]
+
+
+# =============================================================================
+# Key Generator Fixtures
+# =============================================================================
+
+@pytest.fixture(scope="session")
+def pubkey_gen_acct0() -> PublicKeyGenerator:
+    """Return a PublicKeyGenerator for account 0 of the known master xprv."""
+    return PublicKeyGenerator.from_master_xprv(
+        TEST_MASTER_XPRV,
+        is_multisig=False,
+        account_index=0
+    )
+
+
+@pytest.fixture(scope="session")
+def privkey_gen_acct0() -> PrivateKeyGenerator:
+    """Return a PrivateKeyGenerator for account 0 of the known master xprv."""
+    return PrivateKeyGenerator(
+        xprv=TEST_MASTER_XPRV,
+        is_multisig=False,
+        account_index=0
+    )
+
+
 # =============================================================================
 # Address Fixtures
 # =============================================================================
@@ -111,6 +174,32 @@ def known_mainnet_address() -> Address:
     return Address(TEST_MAINNET_ADDRESS)
 
 
+# =============================================================================
+# Script Fixtures
+# =============================================================================
+
+@pytest.fixture
+def op_true_builder() -> ScriptBuilder:
+    """Return a fresh ScriptBuilder holding a single OP_TRUE."""
+    builder = ScriptBuilder()
+    builder.add_op(Opcodes.OpTrue)
+    return builder
+
+
+# =============================================================================
+# Signing Helpers
+# =============================================================================
+
+@functools.lru_cache(maxsize=None)
+def cached_sign_message(message: str, private_key: PrivateKey) -> str:
+    """Sign `message` deterministically (no_aux_rand), once per (message, key).
+
+    Deterministic signing makes the cached signature identical to a fresh
+    one. Keys are cached by identity, so pass the session-scoped key fixtures.
+    """
+    return sign_message(message, private_key, no_aux_rand=True)
+
+
 # =============================================================================
 # Integration Test Fixtures (Network Required)
 # =============================================================================
@@ -5,7 +5,7 @@ Unit tests for the Address class.
 import pytest
 
 from kaspa import Address, PublicKey, ScriptPublicKey, pay_to_address_script, address_from_script_public_key
-from tests.conftest import TEST_MAINNET_ADDRESS
+from tests.conftest import TEST_MAINNET_ADDRESS, TEST_COMPRESSED_PUBLIC_KEY_HEX
 
 
 class TestAddressCreation:
@@ -63,6 +63,10 @@ class TestAddressProperties:
         expected_payload = full_address.split(":")[1]
         assert payload == expected_payload
 
+    def test_address_payload_bytes(self, known_mainnet_address):
+        """Test that payload_bytes returns the raw payload (all-zero for the burn address)."""
+        assert known_mainnet_address.payload_bytes == bytes(32)
+
     def test_address_short(self, known_mainnet_address):
         """Test that short() returns a shortened address representation."""
         short_addr = known_mainnet_address.short(4)
@@ -104,6 +108,12 @@ class TestAddressFromKey:
         assert isinstance(address, Address)
         assert address.prefix == "kaspa"
 
+    def test_address_from_public_key_ecdsa(self, known_ecdsa_public_key, known_keypair):
+        """Test creating an ECDSA address from a compressed public key."""
+        address = known_ecdsa_public_key.to_address_ecdsa("mainnet")
+        assert address.payload_bytes == bytes.fromhex(TEST_COMPRESSED_PUBLIC_KEY_HEX)
+        assert address == known_keypair.to_address_ecdsa("mainnet")
+
     def test_private_key_and_keypair_produce_same_address(self, known_private_key, known_keypair):
         """Test that the same address is produced from private key and its keypair."""
         addr_from_privkey = known_private_key.to_address("mainnet")
@@ -47,51 +47,27 @@ class TestPublicKeyGeneratorCreation:
 class TestPublicKeyGeneratorReceiveKeys:
     """Tests for PublicKeyGenerator receive key generation."""
 
-    def test_receive_pubkey_single(self):
+    def test_receive_pubkey_single(self, pubkey_gen_acct0):
         """Test generating a single receive public key."""
-        pubkey_gen = PublicKeyGenerator.from_master_xprv(
-            TEST_MASTER_XPRV,
-            is_multisig=False,
-            account_index=0
-        )
-
-        pubkey = pubkey_gen.receive_pubkey(0)
+        pubkey = pubkey_gen_acct0.receive_pubkey(0)
         assert isinstance(pubkey, PublicKey)
 
-    def test_receive_pubkeys_range(self):
+    def test_receive_pubkeys_range(self, pubkey_gen_acct0):
         """Test generating a range of receive public keys."""
-        pubkey_gen = PublicKeyGenerator.from_master_xprv(
-            TEST_MASTER_XPRV,
-            is_multisig=False,
-            account_index=0
-        )
-
-        pubkeys = pubkey_gen.receive_pubkeys(0, 10)
+        pubkeys = pubkey_gen_acct0.receive_pubkeys(0, 10)
         assert len(pubkeys) == 10
         for key in pubkeys:
             assert isinstance(key, PublicKey)
 
-    def test_receive_pubkey_as_string(self):
+    def test_receive_pubkey_as_string(self, pubkey_gen_acct0):
         """Test generating a receive public key as string."""
-        pubkey_gen = PublicKeyGenerator.from_master_xprv(
-            TEST_MASTER_XPRV,
-            is_multisig=False,
-            account_index=0
-        )
-
-        key_str = pubkey_gen.receive_pubkey_as_string(0)
+        key_str = pubkey_gen_acct0.receive_pubkey_as_string(0)
         assert isinstance(key_str, str)
         assert len(key_str) > 0
 
-    def test_receive_pubkeys_as_strings(self):
+    def test_receive_pubkeys_as_strings(self, pubkey_gen_acct0):
         """Test generating multiple receive public keys as strings."""
-        pubkey_gen = PublicKeyGenerator.from_master_xprv(
-            TEST_MASTER_XPRV,
-            is_multisig=False,
-            account_index=0
-        )
-
-        key_strs = pubkey_gen.receive_pubkeys_as_strings(0, 5)
+        key_strs = pubkey_gen_acct0.receive_pubkeys_as_strings(0, 5)
         assert len(key_strs) == 5
         for key_str in key_strs:
             assert isinstance(key_str, str)
@@ -100,143 +76,77 @@ class TestPublicKeyGeneratorReceiveKeys:
 class TestPublicKeyGeneratorReceiveAddresses:
     """Tests for PublicKeyGenerator receive address generation."""
 
-    def test_receive_address_single(self):
+    def test_receive_address_single(self, pubkey_gen_acct0):
         """Test generating a single receive address."""
-        pubkey_gen = PublicKeyGenerator.from_master_xprv(
-            TEST_MASTER_XPRV,
-            is_multisig=False,
-            account_index=0
-        )
-
-        address = pubkey_gen.receive_address("mainnet", 0)
+        address = pubkey_gen_acct0.receive_address("mainnet", 0)
         assert isinstance(address, Address)
         assert address.prefix == "kaspa"
 
-    def test_receive_addresses_range(self):
+    def test_receive_addresses_range(self, pubkey_gen_acct0):
         """Test generating a range of receive addresses."""
-        pubkey_gen = PublicKeyGenerator.from_master_xprv(
-            TEST_MASTER_XPRV,
-            is_multisig=False,
-            account_index=0
-        )
-
-        addresses = pubkey_gen.receive_addresses("mainnet", 0, 10)
+        addresses = pubkey_gen_acct0.receive_addresses("mainnet", 0, 10)
         assert len(addresses) == 10
         for addr in addresses:
             assert isinstance(addr, Address)
             assert addr.prefix == "kaspa"
 
-    def test_receive_address_as_string(self):
+    def test_receive_address_as_string(self, pubkey_gen_acct0):
         """Test generating a receive address as string."""
-        pubkey_gen = PublicKeyGenerator.from_master_xprv(
-            TEST_MASTER_XPRV,
-            is_multisig=False,
-            account_index=0
-        )
+        addr_str = pubkey_gen_acct0.receive_address_as_string("mainnet", 0)
+        assert addr_str[:6] == "kaspa:"
 
-        addr_str = pubkey_gen.receive_address_as_string("mainnet", 0)
-        assert addr_str.startswith("kaspa:")
-
-    def test_receive_addresses_as_strings(self):
+    def test_receive_addresses_as_strings(self, pubkey_gen_acct0):
         """Test generating multiple receive addresses as strings."""
-        pubkey_gen = PublicKeyGenerator.from_master_xprv(
-            TEST_MASTER_XPRV,
-            is_multisig=False,
-            account_index=0
-        )
-
-        addr_strs = pubkey_gen.receive_addresses_as_strings("mainnet", 0, 5)
+        addr_strs = pubkey_gen_acct0.receive_addresses_as_strings("mainnet", 0, 5)
         assert len(addr_strs) == 5
         for addr_str in addr_strs:
-            assert addr_str.startswith("kaspa:")
+            assert addr_str[:6] == "kaspa:"
 
 
 class TestPublicKeyGeneratorChangeKeys:
     """Tests for PublicKeyGenerator change key generation."""
 
-    def test_change_pubkey_single(self):
+    def test_change_pubkey_single(self, pubkey_gen_acct0):
         """Test generating a single change public key."""
-        pubkey_gen = PublicKeyGenerator.from_master_xprv(
-            TEST_MASTER_XPRV,
-            is_multisig=False,
-            account_index=0
-        )
-
-        pubkey = pubkey_gen.change_pubkey(0)
+        pubkey = pubkey_gen_acct0.change_pubkey(0)
         assert isinstance(pubkey, PublicKey)
 
-    def test_change_pubkeys_range(self):
+    def test_change_pubkeys_range(self, pubkey_gen_acct0):
         """Test generating a range of change public keys."""
-        pubkey_gen = PublicKeyGenerator.from_master_xprv(
-            TEST_MASTER_XPRV,
-            is_multisig=False,
-            account_index=0
-        )
-
-        pubkeys = pubkey_gen.change_pubkeys(0, 10)
+        pubkeys = pubkey_gen_acct0.change_pubkeys(0, 10)
         assert len(pubkeys) == 10
 
-    def test_change_address_single(self):
+    def test_change_address_single(self, pubkey_gen_acct0):
         """Test generating a single change address."""
-        pubkey_gen = PublicKeyGenerator.from_master_xprv(
-            TEST_MASTER_XPRV,
-            is_multisig=False,
-            account_index=0
-        )
-
-        address = pubkey_gen.change_address("mainnet", 0)
+        address = pubkey_gen_acct0.change_address("mainnet", 0)
         assert address.prefix == "kaspa"
 
-    def test_change_addresses_range(self):
+    def test_change_addresses_range(self, pubkey_gen_acct0):
         """Test generating a range of change addresses."""
-        pubkey_gen = PublicKeyGenerator.from_master_xprv(
-            TEST_MASTER_XPRV,
-            is_multisig=False,
-            account_index=0
-        )
-
-        addresses = pubkey_gen.change_addresses("mainnet", 0, 10)
+        addresses = pubkey_gen_acct0.change_addresses("mainnet", 0, 10)
         assert len(addresses) == 10
 
 
 class TestPublicKeyGeneratorDifferentNetworks:
     """Tests for PublicKeyGenerator with different networks."""
 
-    def test_receive_address_testnet(self):
+    def test_receive_address_testnet(self, pubkey_gen_acct0):
         """Test generating testnet receive addresses."""
-        pubkey_gen = PublicKeyGenerator.from_master_xprv(
-            TEST_MASTER_XPRV,
-            is_multisig=False,
-            account_index=0
-        )
-
-        address = pubkey_gen.receive_address("testnet", 0)
+        address = pubkey_gen_acct0.receive_address("testnet", 0)
         assert address.prefix == "kaspatest"
 
-    def test_change_address_testnet(self):
+    def test_change_address_testnet(self, pubkey_gen_acct0):
         """Test generating testnet change addresses."""
-        pubkey_gen = PublicKeyGenerator.from_master_xprv(
-            TEST_MASTER_XPRV,
-            is_multisig=False,
-            account_index=0
-        )
-
-        address = pubkey_gen.change_address("testnet", 0)
+        address = pubkey_gen_acct0.change_address("testnet", 0)
         assert address.prefix == "kaspatest"
 
 
 class TestPublicKeyGeneratorToString:
     """Tests for PublicKeyGenerator serialization."""
 
-    def test_to_string(self):
+    def test_to_string(self, pubkey_gen_acct0):
         """Test serializing PublicKeyGenerator to string."""
-        pubkey_gen = PublicKeyGenerator.from_master_xprv(
-            TEST_MASTER_XPRV,
-            is_multisig=False,
-            account_index=0
-        )
-
-        gen_str = pubkey_gen.to_string()
+        gen_str = pubkey_gen_acct0.to_string()
         assert isinstance(gen_str, str)
 
 
@@ -306,87 +216,52 @@ class TestPrivateKeyGeneratorCreation:
 class TestPrivateKeyGeneratorKeys:
     """Tests for PrivateKeyGenerator key generation."""
 
-    def test_receive_key(self):
+    def test_receive_key(self, privkey_gen_acct0):
         """Test generating a receive private key."""
-        privkey_gen = PrivateKeyGenerator(
-            xprv=TEST_MASTER_XPRV,
-            is_multisig=False,
-            account_index=0
-        )
-
-        private_key = privkey_gen.receive_key(0)
+        private_key = privkey_gen_acct0.receive_key(0)
         assert isinstance(private_key, PrivateKey)
 
-    def test_change_key(self):
+    def test_change_key(self, privkey_gen_acct0):
         """Test generating a change private key."""
-        privkey_gen = PrivateKeyGenerator(
-            xprv=TEST_MASTER_XPRV,
-            is_multisig=False,
-            account_index=0
-        )
-
-        private_key = privkey_gen.change_key(0)
+        private_key = privkey_gen_acct0.change_key(0)
         assert isinstance(private_key, PrivateKey)
 
-    def test_receive_key_different_indices(self):
+    def test_receive_key_different_indices(self, privkey_gen_acct0):
         """Test that different indices produce different keys."""
-        privkey_gen = PrivateKeyGenerator(
-            xprv=TEST_MASTER_XPRV,
-            is_multisig=False,
-            account_index=0
-        )
-
-        key0 = privkey_gen.receive_key(0)
-        key1 = privkey_gen.receive_key(1)
+        key0, key1 = privkey_gen_acct0.receive_keys([0, 1])
 
         assert key0.to_string() != key1.to_string()
 
+    def test_receive_keys_match_receive_key(self, privkey_gen_acct0):
+        """Test that batched receive keys match individually derived keys."""
+        keys = privkey_gen_acct0.receive_keys([3, 0, 7])
+
+        assert [k.to_string() for k in keys] == [
+            privkey_gen_acct0.receive_key(i).to_string() for i in (3, 0, 7)
+        ]
+
 
 class TestKeyGeneratorConsistency:
     """Tests for consistency between PublicKeyGenerator and PrivateKeyGenerator."""
 
-    def test_public_private_generators_produce_matching_keys(self):
+    def test_public_private_generators_produce_matching_keys(self, pubkey_gen_acct0, privkey_gen_acct0):
         """Test that public and private generators produce matching key pairs."""
-        pubkey_gen = PublicKeyGenerator.from_master_xprv(
-            TEST_MASTER_XPRV,
-            is_multisig=False,
-            account_index=0
-        )
-
-        privkey_gen = PrivateKeyGenerator(
-            xprv=TEST_MASTER_XPRV,
-            is_multisig=False,
-            account_index=0
-        )
-
         # Get receive address from public key generator
-        addr_from_pubgen = pubkey_gen.receive_address("mainnet", 0)
+        addr_from_pubgen = pubkey_gen_acct0.receive_address("mainnet", 0)
 
         # Get receive private key and derive address
-        private_key = privkey_gen.receive_key(0)
+        private_key = privkey_gen_acct0.receive_key(0)
         addr_from_privgen = private_key.to_address("mainnet")
 
         assert addr_from_pubgen.to_string() == addr_from_privgen.to_string()
 
-    def test_change_keys_consistency(self):
+    def test_change_keys_consistency(self, pubkey_gen_acct0, privkey_gen_acct0):
         """Test consistency between change key generators."""
-        pubkey_gen = PublicKeyGenerator.from_master_xprv(
-            TEST_MASTER_XPRV,
-            is_multisig=False,
-            account_index=0
-        )
-
-        privkey_gen = PrivateKeyGenerator(
-            xprv=TEST_MASTER_XPRV,
-            is_multisig=False,
-            account_index=0
-        )
-
         # Get change address from public key generator
-        addr_from_pubgen = pubkey_gen.change_address("mainnet", 0)
+        addr_from_pubgen = pubkey_gen_acct0.change_address("mainnet", 0)
 
         # Get change private key and derive address
-        private_key = privkey_gen.change_key(0)
+        private_key = privkey_gen_acct0.change_key(0)
         addr_from_privgen = private_key.to_address("mainnet")
 
         assert addr_from_pubgen.to_string() == addr_from_privgen.to_string()
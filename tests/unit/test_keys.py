@@ -9,16 +9,42 @@ from tests.conftest import (
     TEST_PRIVATE_KEY_HEX,
     TEST_PUBLIC_KEY_HEX,
     TEST_COMPRESSED_PUBLIC_KEY_HEX,
+    TEST_PRIVATE_KEY_BYTES,
+    TEST_PUBLIC_KEY_BYTES,
+)
+
+# Pure CPU-bound crypto with read-only session fixtures; keep the module on
+# one xdist worker (`--dist loadgroup`) so those fixtures are built once.
+pytestmark = pytest.mark.xdist_group("keys")
+
+FULL_DER_PUBLIC_KEY_HEX = (
+    "0421eb0c4270128b16c93c5f0dac48d56051a6237dae997b58912695052818e348"
+    "b0a895cbd0c93a11ee7afac745929d96a4642a71831f54a7377893af71a2e2ae"
+)
+
+# x-only (32-byte), compressed (33-byte) and full DER (65-byte) encodings
+PUBLIC_KEY_HEX_FORMS = pytest.mark.parametrize(
+    "key_hex",
+    [TEST_PUBLIC_KEY_HEX, TEST_COMPRESSED_PUBLIC_KEY_HEX, FULL_DER_PUBLIC_KEY_HEX],
+    ids=["x_only", "compressed", "full_der"],
 )
 
 
 class TestPrivateKeyCreation:
     """Tests for PrivateKey construction."""
 
-    def test_create_private_key_from_valid_hex(self):
-        """Test creating a PrivateKey from a valid hex string."""
-        private_key = PrivateKey(TEST_PRIVATE_KEY_HEX)
-        assert private_key is not None
+    @pytest.mark.parametrize(
+        "key_src",
+        [TEST_PRIVATE_KEY_HEX, TEST_PRIVATE_KEY_BYTES],
+        ids=["hex", "bytes"],
+    )
+    def test_create_private_key(self, key_src):
+        """Test creating a PrivateKey from a valid hex string or raw bytes."""
+        if isinstance(key_src, bytes):
+            private_key = PrivateKey.from_bytes(key_src)
+        else:
+            private_key = PrivateKey(key_src)
+        assert private_key.to_string() == TEST_PRIVATE_KEY_HEX
 
     def test_create_private_key_from_invalid_hex_raises(self):
         """Test that creating a PrivateKey from invalid hex raises an error."""
@@ -30,6 +56,11 @@ class TestPrivateKeyCreation:
         with pytest.raises(Exception):
             PrivateKey("abcd1234")
 
+    def test_create_private_key_from_short_bytes_raises(self):
+        """Test that creating a PrivateKey from too few bytes raises an error."""
+        with pytest.raises(Exception):
+            PrivateKey.from_bytes(TEST_PRIVATE_KEY_BYTES[:16])
+
     def test_private_key_to_string(self, known_private_key):
         """Test that to_string() returns the hex representation."""
         assert known_private_key.to_string() == TEST_PRIVATE_KEY_HEX
@@ -52,21 +83,17 @@ class TestPrivateKeyConversions:
 class TestPublicKeyCreation:
     """Tests for PublicKey construction."""
 
-    def test_create_public_key_from_x_only_hex(self):
-        """Test creating a PublicKey from an x-only (32-byte) hex string."""
-        public_key = PublicKey(TEST_PUBLIC_KEY_HEX)
+    @PUBLIC_KEY_HEX_FORMS
+    def test_create_public_key_from_hex(self, key_hex):
+        """Test creating a PublicKey from each supported hex encoding."""
+        public_key = PublicKey(key_hex)
         assert isinstance(public_key, PublicKey)
 
-    def test_create_public_key_from_compressed_hex(self):
-        """Test creating a PublicKey from a compressed (33-byte) hex string."""
-        public_key = PublicKey(TEST_COMPRESSED_PUBLIC_KEY_HEX)
-        assert public_key is not None
-
-    def test_create_public_key_from_full_der_hex(self):
-        """Test creating a PublicKey from a full DER (65-byte) hex string."""
-        full_der = "0421eb0c4270128b16c93c5f0dac48d56051a6237dae997b58912695052818e348b0a895cbd0c93a11ee7afac745929d96a4642a71831f54a7377893af71a2e2ae"
-        public_key = PublicKey(full_der)
-        assert isinstance(public_key, PublicKey)
+    @PUBLIC_KEY_HEX_FORMS
+    def test_create_public_key_from_bytes(self, key_hex):
+        """Test that from_bytes() matches the hex constructor for each encoding."""
+        public_key = PublicKey.from_bytes(bytes.fromhex(key_hex))
+        assert public_key.to_string() == PublicKey(key_hex).to_string()
 
     def test_create_public_key_from_invalid_hex_raises(self):
         """Test that creating a PublicKey from invalid hex raises an error."""
@@ -109,9 +136,9 @@ class TestXOnlyPublicKey:
         address = x_only.to_address("mainnet")
         assert address.prefix == "kaspa"
 
-    def test_x_only_public_key_from_address(self, known_public_key):
+    def test_x_only_public_key_from_address(self, known_addresses):
         """Test creating an XOnlyPublicKey from an address."""
-        address = known_public_key.to_address("mainnet")
+        address = known_addresses["mainnet"]
         x_only = XOnlyPublicKey.from_address(address)
         assert isinstance(x_only, XOnlyPublicKey)
 
@@ -128,9 +155,15 @@ class TestKeypairCreation:
 
     def test_two_random_keypairs_are_different(self):
         """Test that two random keypairs are different."""
-        keypair1 = Keypair.random()
-        keypair2 = Keypair.random()
-        assert keypair1.private_key != keypair2.private_key
+        keypair1, keypair2 = Keypair.random_batch(2)
+        assert keypair1.private_key_bytes != keypair2.private_key_bytes
+
+    def test_keypair_random_batch(self):
+        """Test generating a batch of random Keypairs."""
+        keypairs = Keypair.random_batch(4)
+        assert len(keypairs) == 4
+        assert len({kp.private_key for kp in keypairs}) == 4
+        assert Keypair.random_batch(0) == []
 
     def test_keypair_from_private_key(self, known_private_key):
         """Test creating a Keypair from a PrivateKey."""
@@ -146,6 +179,10 @@ class TestKeypairProperties:
         private_key = known_keypair.private_key
         assert isinstance(private_key, str)
 
+    def test_keypair_private_key_bytes_property(self, known_keypair):
+        """Test that private_key_bytes is the raw form of private_key."""
+        assert known_keypair.private_key_bytes == TEST_PRIVATE_KEY_BYTES
+
     def test_keypair_public_key_property(self, known_keypair):
         """Test accessing the public_key property."""
         public_key = known_keypair.public_key
@@ -160,10 +197,10 @@ class TestKeypairProperties:
 class TestKeyConsistency:
     """Tests for consistency between different key representations."""
 
-    def test_private_key_public_key_address_consistency(self, known_private_key):
+    def test_private_key_public_key_address_consistency(self, known_private_key, known_addresses):
         """Test that derived keys produce the same address."""
         # Get address directly from private key
-        addr1 = known_private_key.to_address("mainnet")
+        addr1 = known_addresses["mainnet"]
 
         # Get address via public key
         public_key = known_private_key.to_public_key()
@@ -173,8 +210,10 @@ class TestKeyConsistency:
         keypair = known_private_key.to_keypair()
         addr3 = keypair.to_address("mainnet")
 
-        assert addr1.to_string() == addr2.to_string()
-        assert addr2.to_string() == addr3.to_string()
+        # Address equality compares prefix, version and payload directly
+        assert addr1 == addr2 == addr3
+        # A Schnorr address payload is the x-only public key itself
+        assert addr1.payload_bytes == addr2.payload_bytes == TEST_PUBLIC_KEY_BYTES
 
     def test_keypair_private_key_matches_source(self, known_private_key):
         """Test that a keypair's private key matches the source."""
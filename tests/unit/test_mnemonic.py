@@ -2,11 +2,19 @@
 Unit tests for the Mnemonic class.
 """
 
+import re
+
 import pytest
 
 from kaspa import Mnemonic, Language
 from tests.conftest import TEST_MNEMONIC_PHRASE
 
+# Shares the session-scoped known_mnemonic fixture with the key tests.
+pytestmark = pytest.mark.xdist_group("keys")
+
+_HEX_RE = re.compile(rb"[0-9a-fA-F]+")
+_LOWER_HEX_DIGITS = frozenset(b"0123456789abcdef")
+
 
 class TestMnemonicCreation:
     """Tests for Mnemonic construction."""
@@ -35,8 +43,8 @@ class TestMnemonicCreation:
     def test_random_mnemonic_12_words(self):
         """Test creating a random 12-word mnemonic."""
         mnemonic = Mnemonic.random(word_count=12)
-        words = mnemonic.phrase.split()
-        assert len(words) == 12
+        # 12 single-space separated words
+        assert mnemonic.phrase.count(" ") == 11
         assert mnemonic.validate(mnemonic.phrase)
 
     def test_two_random_mnemonics_are_different(self):
@@ -76,7 +84,7 @@ class TestMnemonicProperties:
         entropy = known_mnemonic.entropy
         assert isinstance(entropy, str)
         # Entropy should be a hex string
-        assert all(c in '0123456789abcdef' for c in entropy.lower())
+        assert _HEX_RE.fullmatch(entropy.encode())
 
 
 class TestMnemonicSeed:
@@ -88,7 +96,7 @@ class TestMnemonicSeed:
         assert isinstance(seed, str)
         # Seed should be a hex string (64 bytes = 128 hex chars)
         assert len(seed) == 128
-        assert all(c in '0123456789abcdef' for c in seed.lower())
+        assert set(seed.encode()) <= _LOWER_HEX_DIGITS
 
     def test_to_seed_with_password(self, known_mnemonic):
         """Test generating a seed with a password (25th word)."""
@@ -101,30 +109,30 @@ class TestMnemonicSeed:
         seed = known_mnemonic.to_seed("")
         assert isinstance(seed, str)
 
-    def test_same_mnemonic_same_seed(self):
+    def test_same_mnemonic_same_seed(self, known_mnemonic):
         """Test that the same mnemonic produces the same seed."""
-        mnemonic1 = Mnemonic(phrase=TEST_MNEMONIC_PHRASE)
-        mnemonic2 = Mnemonic(phrase=TEST_MNEMONIC_PHRASE)
-
-        seed1 = mnemonic1.to_seed()
-        seed2 = mnemonic2.to_seed()
-
-        assert seed1 == seed2
+        assert known_mnemonic.to_seed() == known_mnemonic.to_seed()
 
     def test_different_password_different_seed(self, known_mnemonic):
         """Test that different passwords produce different seeds."""
-        seed1 = known_mnemonic.to_seed("password1")
-        seed2 = known_mnemonic.to_seed("password2")
+        seed1, seed2 = known_mnemonic.to_seed_many(["password1", "password2"])
 
         assert seed1 != seed2
 
     def test_password_vs_no_password_different_seed(self, known_mnemonic):
         """Test that using a password produces a different seed than no password."""
-        seed_no_password = known_mnemonic.to_seed()
-        seed_with_password = known_mnemonic.to_seed("any_password")
+        seed_no_password, seed_with_password = known_mnemonic.to_seed_many(["", "any_password"])
 
         assert seed_no_password != seed_with_password
 
+    def test_to_seed_many_matches_to_seed(self, known_mnemonic):
+        """Test that batched seeds match individually derived seeds."""
+        passwords = ["", "my_password", "password1"]
+        seeds = known_mnemonic.to_seed_many(passwords)
+
+        assert seeds == [known_mnemonic.to_seed(p) for p in passwords]
+        assert seeds[0] == known_mnemonic.to_seed()
+
 
 class TestMnemonicDeterminism:
     """Tests for deterministic behavior of mnemonics."""
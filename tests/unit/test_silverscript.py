@@ -512,7 +512,7 @@ class TestCrossModule:
     def test_compiled_script_wraps_into_p2sh_address(self):
         # silverscript (@v2.0.1) bytes consumed by the core (@78257f2) module:
         # the whole architecture rests on this handoff working.
-        assert self._address(100).startswith("kaspatest:")
+        assert self._address(100)[:10] == "kaspatest:"
 
     def test_p2sh_address_is_deterministic(self):
         assert self._address(100) == self._address(100)
@@ -21,6 +21,7 @@ from kaspa import (
     pay_to_address_script,
     sign_transaction,
     compute_sighash,
+    compute_sighashes,
     create_input_signature,
     sign_script_hash,
     create_transaction,
@@ -33,18 +34,42 @@ from kaspa import (
 )
 
 
+# Hex test vectors shared across the tests below
+A_HASH_HEX = "a" * 64
+B_HASH_HEX = "b" * 64
+NATIVE_SUBNETWORK_ID = "0" * 40
+OP_TRUE_SCRIPT = "51"
+PREV_TX_ID = "880eb9819a31821d9d2399e2f35e2433b72637e393d71ecc9b8d0250f49153c3"
+
+
+def _utxo_entry(address, index, amount):
+    """Build a synthetic P2PK UTXO paying `amount` to `address` at PREV_TX_ID:index."""
+    spk = pay_to_address_script(address)
+    return UtxoEntryReference.from_dict({
+        "address": address.to_string(),
+        "outpoint": {"transactionId": PREV_TX_ID, "index": index},
+        "utxoEntry": {
+            "amount": amount,
+            "scriptPublicKey": {"version": 0, "script": spk.script},
+            "blockDaaScore": 0,
+            "isCoinbase": False,
+            "covenantId": None,
+        },
+    })
+
+
 class TestTransactionOutpoint:
     """Tests for TransactionOutpoint class."""
 
     def test_create_outpoint(self):
         """Test creating a TransactionOutpoint."""
-        tx_hash = Hash("0" * 64)  # 32-byte zero hash
+        tx_hash = Hash.zero()
         outpoint = TransactionOutpoint(tx_hash, 0)
         assert isinstance(outpoint, TransactionOutpoint)
 
     def test_outpoint_properties(self):
         """Test TransactionOutpoint properties."""
-        tx_id = "a" * 64
+        tx_id = A_HASH_HEX
         tx_hash = Hash(tx_id)
         outpoint = TransactionOutpoint(tx_hash, 5)
 
@@ -53,7 +78,7 @@ class TestTransactionOutpoint:
 
     def test_outpoint_get_id(self):
         """Test TransactionOutpoint get_id method."""
-        tx_id = "b" * 64
+        tx_id = B_HASH_HEX
         tx_hash = Hash(tx_id)
         outpoint = TransactionOutpoint(tx_hash, 0)
 
@@ -66,7 +91,7 @@ class TestScriptPublicKey:
 
     def test_create_script_public_key_from_hex(self):
         """Test creating a ScriptPublicKey from hex."""
-        script_hex = "20" + "a" * 64 + "ac"  # Sample script
+        script_hex = "20" + A_HASH_HEX + "ac"  # Sample script
         spk = ScriptPublicKey(0, script_hex)
         assert isinstance(spk, ScriptPublicKey)
 
@@ -84,11 +109,12 @@ class TestScriptPublicKey:
 
     def test_script_public_key_script_property(self):
         """Test ScriptPublicKey script property."""
-        script_hex = "51"
+        script_hex = OP_TRUE_SCRIPT
         spk = ScriptPublicKey(0, script_hex)
 
         script = spk.script
         assert isinstance(script, str)
+        assert script == script_hex
 
 
 class TestTransactionOutput:
@@ -96,20 +122,20 @@ class TestTransactionOutput:
 
     def test_create_transaction_output(self):
         """Test creating a TransactionOutput."""
-        spk = ScriptPublicKey(0, "51")
+        spk = ScriptPublicKey(0, OP_TRUE_SCRIPT)
         output = TransactionOutput(1000000, spk)
         assert isinstance(output, TransactionOutput)
 
     def test_transaction_output_value(self):
         """Test TransactionOutput value property."""
-        spk = ScriptPublicKey(0, "51")
+        spk = ScriptPublicKey(0, OP_TRUE_SCRIPT)
         output = TransactionOutput(1000000, spk)
 
         assert output.value == 1000000
 
     def test_transaction_output_value_setter(self):
         """Test setting TransactionOutput value."""
-        spk = ScriptPublicKey(0, "51")
+        spk = ScriptPublicKey(0, OP_TRUE_SCRIPT)
         output = TransactionOutput(1000000, spk)
 
         output.value = 2000000
@@ -121,14 +147,14 @@ class TestTransactionInput:
 
     def test_create_transaction_input(self):
         """Test creating a TransactionInput."""
-        tx_hash = Hash("0" * 64)
+        tx_hash = Hash.zero()
         outpoint = TransactionOutpoint(tx_hash, 0)
         input = TransactionInput(outpoint, "", 0, 1)
         assert isinstance(input, TransactionInput)
 
     def test_transaction_input_properties(self):
         """Test TransactionInput properties."""
-        tx_hash = Hash("a" * 64)
+        tx_hash = Hash(A_HASH_HEX)
         outpoint = TransactionOutpoint(tx_hash, 5)
         input = TransactionInput(outpoint, "deadbeef", 0xFFFFFFFF, 1)
 
@@ -137,75 +163,90 @@ class TestTransactionInput:
         assert input.sig_op_count == 1
 
 
+@pytest.fixture
+def minimal_tx_parts():
+    """Return the (inputs, outputs) lists of a one-input, one-output transaction.
+
+    Transactions built from the same lists share the underlying input and
+    output objects rather than copying them.
+    """
+    input = TransactionInput(TransactionOutpoint(Hash.zero(), 0), "", 0, 1)
+    output = TransactionOutput(1000000, ScriptPublicKey(0, OP_TRUE_SCRIPT))
+    return [input], [output]
+
+
 class TestTransaction:
     """Tests for Transaction class."""
 
-    def test_create_minimal_transaction(self):
+    def test_create_minimal_transaction(self, minimal_tx_parts):
         """Test creating a minimal transaction."""
-        tx_hash = Hash("0" * 64)
-        outpoint = TransactionOutpoint(tx_hash, 0)
-        input = TransactionInput(outpoint, "", 0, 1)
-
-        spk = ScriptPublicKey(0, "51")
-        output = TransactionOutput(1000000, spk)
-
-        tx = Transaction(0, [input], [output], 0, "0" * 40, 0, "", 0)
+        inputs, outputs = minimal_tx_parts
+        tx = Transaction(0, inputs, outputs, 0, NATIVE_SUBNETWORK_ID, 0, "", 0)
         assert isinstance(tx, Transaction)
 
-    def test_transaction_equality(self):
+    def test_transaction_equality(self, minimal_tx_parts):
         """Test transaction equality works."""
-        tx_hash = Hash("0" * 64)
-        outpoint = TransactionOutpoint(tx_hash, 0)
-        input = TransactionInput(outpoint, "", 0, 1)
-
-        spk = ScriptPublicKey(0, "51")
-        output = TransactionOutput(1000000, spk)
-
-        tx1 = Transaction(0, [input], [output], 0, "0" * 40, 0, "", 0)
-        tx2 = Transaction(0, [input], [output], 0, "0" * 40, 0, "", 0)
+        inputs, outputs = minimal_tx_parts
+        tx1 = Transaction(0, inputs, outputs, 0, NATIVE_SUBNETWORK_ID, 0, "", 0)
+        tx2 = Transaction(0, inputs, outputs, 0, NATIVE_SUBNETWORK_ID, 0, "", 0)
         assert tx1 == tx2
 
-    def test_transaction_properties(self):
-        """Test Transaction properties."""
-        tx_hash = Hash("0" * 64)
-        outpoint = TransactionOutpoint(tx_hash, 0)
+    def test_transaction_inequality(self):
+        """Test transactions differing in an output value or count are unequal."""
+        outpoint = TransactionOutpoint(Hash.zero(), 0)
         input = TransactionInput(outpoint, "", 0, 1)
-
-        spk = ScriptPublicKey(0, "51")
+        spk = ScriptPublicKey(0, OP_TRUE_SCRIPT)
         output = TransactionOutput(1000000, spk)
 
-        tx = Transaction(0, [input], [output], 100, "0" * 40, 0, "", 0)
+        tx = Transaction(0, [input], [output], 0, NATIVE_SUBNETWORK_ID, 0, "", 0)
+        other_value = Transaction(
+            0, [input], [TransactionOutput(2000000, spk)], 0, NATIVE_SUBNETWORK_ID, 0, "", 0
+        )
+        extra_output = Transaction(0, [input], [output, output], 0, NATIVE_SUBNETWORK_ID, 0, "", 0)
+        assert tx != other_value
+        assert tx != extra_output
+        assert extra_output != tx
+
+    def test_transaction_properties(self, minimal_tx_parts):
+        """Test Transaction properties."""
+        inputs, outputs = minimal_tx_parts
+        tx = Transaction(0, inputs, outputs, 100, NATIVE_SUBNETWORK_ID, 0, "", 0)
 
         assert tx.version == 0
         assert tx.lock_time == 100
         assert len(tx.inputs) == 1
         assert len(tx.outputs) == 1
 
-    def test_transaction_id(self):
+    def test_transaction_id(self, minimal_tx_parts):
         """Test Transaction id property."""
-        tx_hash = Hash("0" * 64)
-        outpoint = TransactionOutpoint(tx_hash, 0)
-        input = TransactionInput(outpoint, "", 0, 1)
-
-        spk = ScriptPublicKey(0, "51")
-        output = TransactionOutput(1000000, spk)
-
-        tx = Transaction(0, [input], [output], 0, "0" * 40, 0, "", 0)
+        inputs, outputs = minimal_tx_parts
+        tx = Transaction(0, inputs, outputs, 0, NATIVE_SUBNETWORK_ID, 0, "", 0)
 
         tx_id = tx.id
         assert isinstance(tx_id, str)
         assert len(tx_id) == 64  # 32 bytes hex
+        assert tx.id == tx_id
+        assert tx.finalize().to_hex() == tx_id
 
-    def test_transaction_is_coinbase(self):
-        """Test Transaction is_coinbase method."""
-        tx_hash = Hash("0" * 64)
-        outpoint = TransactionOutpoint(tx_hash, 0)
+    def test_transaction_id_updated_by_finalize(self):
+        """Test the stored id only changes once the modified tx is finalized."""
+        outpoint = TransactionOutpoint(Hash.zero(), 0)
         input = TransactionInput(outpoint, "", 0, 1)
+        spk = ScriptPublicKey(0, OP_TRUE_SCRIPT)
 
-        spk = ScriptPublicKey(0, "51")
-        output = TransactionOutput(1000000, spk)
+        outputs = [TransactionOutput(1000000, spk)]
+        tx = Transaction(0, [input], outputs, 0, NATIVE_SUBNETWORK_ID, 0, "", 0)
+        tx_id = tx.id
+
+        tx.outputs = [TransactionOutput(2000000, spk)]
+        assert tx.id == tx_id
+        assert tx.finalize().to_hex() != tx_id
+        assert tx.id != tx_id
 
-        tx = Transaction(0, [input], [output], 0, "0" * 40, 0, "", 0)
+    def test_transaction_is_coinbase(self, minimal_tx_parts):
+        """Test Transaction is_coinbase method."""
+        inputs, outputs = minimal_tx_parts
+        tx = Transaction(0, inputs, outputs, 0, NATIVE_SUBNETWORK_ID, 0, "", 0)
 
         # Regular transaction should not be coinbase
         # (coinbase transactions have specific subnetwork_id)
@@ -243,34 +284,27 @@ class TestComputeSighash:
     """Tests for compute_sighash."""
 
     PRIVATE_KEY_HEX = "b7e151628aed2a6abf7158809cf4f3c762e7160f38b4da56a784d9045190cfef"
-    PREV_TX_ID = "880eb9819a31821d9d2399e2f35e2433b72637e393d71ecc9b8d0250f49153c3"
 
-    def _build_tx(self, signature_script=b"", with_utxo=True, amount=100_000_000):
-        """Build a single-input P2PK transaction spending a synthetic UTXO."""
+    def _build_tx(
+        self, signature_script=b"", with_utxo=True, amount=100_000_000, input_count=1
+    ):
+        """Build a P2PK transaction spending `input_count` synthetic UTXOs."""
         private_key = PrivateKey(self.PRIVATE_KEY_HEX)
         address = private_key.to_address("mainnet")
         spk = pay_to_address_script(address)
 
-        outpoint = TransactionOutpoint(Hash(self.PREV_TX_ID), 0)
-        if with_utxo:
-            from kaspa import UtxoEntryReference
-
-            utxo_ref = UtxoEntryReference.from_dict({
-                "address": address.to_string(),
-                "outpoint": {"transactionId": self.PREV_TX_ID, "index": 0},
-                "utxoEntry": {
-                    "amount": amount,
-                    "scriptPublicKey": {"version": 0, "script": spk.script},
-                    "blockDaaScore": 0,
-                    "isCoinbase": False,
-                    "covenantId": None,
-                },
-            })
-            input = TransactionInput(outpoint, signature_script, 0, 1, utxo=utxo_ref)
-        else:
-            input = TransactionInput(outpoint, signature_script, 0, 1)
+        inputs = []
+        for index in range(input_count):
+            outpoint = TransactionOutpoint(Hash(PREV_TX_ID), index)
+            if with_utxo:
+                utxo_ref = _utxo_entry(address, index, amount)
+                inputs.append(
+                    TransactionInput(outpoint, signature_script, 0, 1, utxo=utxo_ref)
+                )
+            else:
+                inputs.append(TransactionInput(outpoint, signature_script, 0, 1))
         output = TransactionOutput(amount - 10_000, spk)
-        return Transaction(0, [input], [output], 0, "0" * 40, 0, "", 0)
+        return Transaction(0, inputs, [output], 0, NATIVE_SUBNETWORK_ID, 0, "", 0)
 
     def test_compute_sighash_deterministic(self):
         """Test compute_sighash returns a deterministic 32-byte Hash."""
@@ -335,6 +369,40 @@ class TestComputeSighash:
         # Raises if consensus-side signature verification fails
         sign_transaction(tx_signed, [], True)
 
+    def test_compute_sighashes_matches_compute_sighash(self):
+        """Test the batch digests match per-input compute_sighash on a 64-input tx."""
+        tx = self._build_tx(input_count=64)
+        expected = [compute_sighash(tx, index).to_hex() for index in range(64)]
+
+        assert [h.to_hex() for h in compute_sighashes(tx)] == expected
+        assert [h.to_hex() for h in compute_sighashes(tx, [5, 0])] == [
+            expected[5],
+            expected[0],
+        ]
+
+    def test_compute_sighashes_ecdsa(self):
+        """Test the ecdsa flag is applied to every input."""
+        tx = self._build_tx(input_count=2)
+        digests = compute_sighashes(tx, ecdsa=True)
+        assert [h.to_hex() for h in digests] == [
+            compute_sighash(tx, index, ecdsa=True).to_hex() for index in range(2)
+        ]
+
+    def test_compute_sighashes_input_index_out_of_bounds(self):
+        """Test any out-of-bounds input index raises."""
+        tx = self._build_tx(input_count=2)
+        with pytest.raises(Exception, match="out of bounds"):
+            compute_sighashes(tx, [0, 2])
+
+    def test_sign_many_inputs(self):
+        """Test signing and verifying every input of a 64-input tx."""
+        private_key = PrivateKey(self.PRIVATE_KEY_HEX)
+        tx = self._build_tx(input_count=64)
+
+        # Raises if consensus-side signature verification fails
+        signed = sign_transaction(tx, [private_key], True)
+        assert all(input.signature_script_as_hex for input in signed.inputs)
+
     def test_compute_sighash_commits_to_amount(self):
         """Test a signature over a digest from different tx data fails verification."""
         private_key = PrivateKey(self.PRIVATE_KEY_HEX)
@@ -359,5 +427,32 @@ class TestCreateTransaction:
 
 class TestGenerator:
     """Tests for Generator class."""
-    # TODO
-    pass
+
+    def _build_generator(self, address, entry_count=3, amount=1_000_000_000):
+        """Build a Generator paying 1 KAS back to `address` from synthetic UTXOs."""
+        entries = [_utxo_entry(address, index, amount) for index in range(entry_count)]
+        return Generator(
+            entries=entries,
+            change_address=address,
+            network_id="mainnet",
+            outputs=[{"address": address, "amount": 100_000_000}],
+        )
+
+    def test_summary_tracks_generation(self, known_addresses):
+        """Test summary() reflects progress, so it cannot be computed once up front."""
+        generator = self._build_generator(known_addresses["mainnet"])
+        assert generator.summary().transactions == 0
+
+        estimate = generator.estimate()
+        assert estimate.transactions > 0
+        assert generator.summary().transactions == estimate.transactions
+
+    def test_estimate_is_repeatable(self, known_addresses):
+        """Test a second estimate() on a drained generator returns the same summary."""
+        generator = self._build_generator(known_addresses["mainnet"])
+        first = generator.estimate()
+        second = generator.estimate()
+
+        assert second.fees == first.fees
+        assert second.transactions == first.transactions
+        assert second.final_transaction_id == first.final_transaction_id
@@ -6,70 +6,55 @@ import pytest
 
 from kaspa import (
     kaspa_to_sompi,
+    kaspa_to_sompi_many,
     sompi_to_kaspa,
+    sompi_to_kaspa_many,
     sompi_to_kaspa_string_with_suffix,
     sign_message,
     verify_message,
+    verify_messages,
     Address,
-    PrivateKey,
-    PublicKey,
     Hash,
     AccountKind,
     create_multisig_address,
 )
+from tests.conftest import cached_sign_message
 
 
-class TestKaspaSompiConversions:
-    """Tests for Kaspa/Sompi conversion functions."""
-
-    def test_kaspa_to_sompi_whole_number(self):
-        """Test converting whole Kaspa to Sompi."""
-        result = kaspa_to_sompi(1.0)
-        assert result == 100_000_000
-
-    def test_kaspa_to_sompi_with_decimals(self):
-        """Test converting Kaspa with decimals to Sompi."""
-        result = kaspa_to_sompi(1.5)
-        assert result == 150_000_000
-
-    def test_kaspa_to_sompi_small_value(self):
-        """Test converting small Kaspa value to Sompi."""
-        result = kaspa_to_sompi(0.00000001)
-        assert result == 1
+# (KAS, sompi) pairs that convert exactly in both directions
+KASPA_SOMPI_CASES = [
+    pytest.param(1.0, 100_000_000, id="whole_number"),
+    pytest.param(1.5, 150_000_000, id="with_decimals"),
+    pytest.param(0.00000001, 1, id="small_value"),
+    pytest.param(100.833, 10_083_300_000, id="large_value"),
+    pytest.param(0.0, 0, id="zero"),
+]
 
-    def test_kaspa_to_sompi_large_value(self):
-        """Test converting large Kaspa value to Sompi."""
-        result = kaspa_to_sompi(100.833)
-        assert result == 10_083_300_000
 
-    def test_kaspa_to_sompi_zero(self):
-        """Test converting zero Kaspa to Sompi."""
-        result = kaspa_to_sompi(0.0)
-        assert result == 0
-
-
-class TestSompiToKaspa:
-    """Tests for Sompi to Kaspa conversions."""
+class TestKaspaSompiConversions:
+    """Tests for Kaspa/Sompi conversion functions."""
 
-    def test_sompi_to_kaspa_whole_number(self):
-        """Test converting whole Sompi to Kaspa."""
-        result = sompi_to_kaspa(100_000_000)
-        assert result == 1.0
+    @pytest.mark.parametrize("kaspa,sompi", KASPA_SOMPI_CASES)
+    def test_kaspa_to_sompi(self, kaspa, sompi):
+        """Test converting Kaspa to Sompi."""
+        assert kaspa_to_sompi(kaspa) == sompi
 
-    def test_sompi_to_kaspa_with_remainder(self):
-        """Test converting Sompi with remainder to Kaspa."""
-        result = sompi_to_kaspa(150_000_000)
-        assert result == 1.5
+    @pytest.mark.parametrize("kaspa,sompi", KASPA_SOMPI_CASES)
+    def test_sompi_to_kaspa(self, kaspa, sompi):
+        """Test converting Sompi to Kaspa."""
+        assert sompi_to_kaspa(sompi) == kaspa
 
-    def test_sompi_to_kaspa_small_value(self):
-        """Test converting small Sompi to Kaspa."""
-        result = sompi_to_kaspa(1)
-        assert result == 0.00000001
+    def test_kaspa_to_sompi_many(self):
+        """Test the batch conversion matches elementwise kaspa_to_sompi."""
+        kaspa = [case.values[0] for case in KASPA_SOMPI_CASES]
+        assert kaspa_to_sompi_many(kaspa) == [kaspa_to_sompi(k) for k in kaspa]
+        assert kaspa_to_sompi_many(tuple(kaspa)) == kaspa_to_sompi_many(kaspa)
+        assert kaspa_to_sompi_many([]) == []
 
-    def test_sompi_to_kaspa_zero(self):
-        """Test converting zero Sompi to Kaspa."""
-        result = sompi_to_kaspa(0)
-        assert result == 0.0
+    def test_sompi_to_kaspa_many(self):
+        """Test the batch conversion matches elementwise sompi_to_kaspa."""
+        sompi = [case.values[1] for case in KASPA_SOMPI_CASES]
+        assert sompi_to_kaspa_many(sompi) == [sompi_to_kaspa(s) for s in sompi]
 
 
 class TestSompiToKaspaString:
@@ -96,20 +81,41 @@ class TestSompiToKaspaString:
 class TestRoundTrip:
     """Tests for round-trip conversions."""
 
-    def test_kaspa_sompi_roundtrip(self):
+    @pytest.mark.parametrize("original", [1.0, 1.5, 0.00000001, 100.833, 123.45678901, 0.0])
+    def test_kaspa_sompi_roundtrip(self, original):
         """Test round-trip conversion: Kaspa -> Sompi -> Kaspa."""
-        original = 123.45678901
-        sompi = kaspa_to_sompi(original)
-        back = sompi_to_kaspa(sompi)
-        # assert abs(back - 123.45678901) < 0.000000001
-        assert back == original
+        assert sompi_to_kaspa(kaspa_to_sompi(original)) == original
 
-    def test_sompi_kaspa_roundtrip(self):
+    @pytest.mark.parametrize("original", [1, 150_000_000, 10_083_300_000, 12345678901, 0])
+    def test_sompi_kaspa_roundtrip(self, original):
         """Test round-trip conversion: Sompi -> Kaspa -> Sompi."""
-        original = 12345678901
-        kaspa = sompi_to_kaspa(original)
-        back = kaspa_to_sompi(kaspa)
-        assert back == original
+        assert kaspa_to_sompi(sompi_to_kaspa(original)) == original
+
+
+VERIFY_CASES = [
+    "valid",
+    "invalid_signature",
+    "invalid_nonce",
+    "wrong_message",
+    "wrong_public_key",
+]
+
+
+@pytest.fixture
+def verify_cases(known_private_key, known_public_key, multisig_keys_3):
+    """Map each VERIFY_CASES id to its verify_message args and expected result."""
+    message = "Hello Kaspa!"
+    signature = cached_sign_message(message, known_private_key)
+    # Valid but different public key
+    other_key = multisig_keys_3[0]
+    return {
+        "valid": ((message, signature, known_public_key), True),
+        "invalid_signature": ((message, "a" * 128, known_public_key), False),
+        # Nonce x-coordinate above the field prime, so not a curve point
+        "invalid_nonce": ((message, "ff" * 32 + signature[64:], known_public_key), False),
+        "wrong_message": (("Wrong message", signature, known_public_key), False),
+        "wrong_public_key": ((message, signature, other_key), False),
+    }
 
 
 class TestMessageSigning:
@@ -123,43 +129,17 @@ class TestMessageSigning:
         assert isinstance(signature, str)
         assert len(signature) > 0
 
-    def test_verify_message_valid(self, known_private_key, known_public_key):
-        """Test verifying a valid message signature."""
-        message = "Hello Kaspa!"
-        signature = sign_message(message, known_private_key)
-
-        is_valid = verify_message(message, signature, known_public_key)
-        assert is_valid is True
-
-    def test_verify_message_invalid_signature(self, known_public_key):
-        """Test verifying an invalid signature returns False."""
-        message = "Hello Kaspa!"
-        # Invalid signature (random hex)
-        fake_signature = "a" * 128
+    @pytest.mark.parametrize("case", VERIFY_CASES)
+    def test_verify_message(self, verify_cases, case):
+        """Test verify_message against valid and tampered inputs."""
+        args, expected = verify_cases[case]
+        assert verify_message(*args) is expected
 
-        is_valid = verify_message(message, fake_signature, known_public_key)
-        assert is_valid is False
-
-    def test_verify_message_wrong_message(self, known_private_key, known_public_key):
-        """Test verifying with wrong message returns False."""
-        message1 = "Hello Kaspa!"
-        message2 = "Wrong message"
-
-        signature = sign_message(message1, known_private_key)
-        is_valid = verify_message(message2, signature, known_public_key)
-
-        assert is_valid is False
-
-    def test_verify_message_wrong_public_key(self, known_private_key):
-        """Test verifying with wrong public key returns False."""
-        message = "Hello Kaspa!"
-        signature = sign_message(message, known_private_key)
-
-        # Use a different public key (valid but different)
-        other_key = PrivateKey("1" * 64).to_public_key()
-
-        is_valid = verify_message(message, signature, other_key)
-        assert is_valid is False
+    def test_verify_messages(self, verify_cases):
+        """Test verifying all cases in a single batch call."""
+        cases = [verify_cases[case] for case in VERIFY_CASES]
+        results = verify_messages([args for args, _ in cases])
+        assert results == [expected for _, expected in cases]
 
     def test_sign_message_with_no_aux_rand(self, known_private_key):
         """Test signing with no_aux_rand option."""
@@ -196,6 +176,11 @@ class TestHash:
         result = hash_obj.to_string()
         assert isinstance(result, str)
 
+    def test_hash_zero(self):
+        """Test Hash.zero matches the zero hash parsed from hex."""
+        assert Hash.zero() == Hash("0" * 64)
+        assert bytes(Hash.zero()) == bytes(32)
+
 
 class TestAccountKind:
     """Tests for AccountKind class."""
@@ -222,67 +207,44 @@ class TestAccountKind:
 class TestMultisigAddress:
     """Tests for multisig address creation."""
 
-    def test_create_multisig_address(self):
+    def test_create_multisig_address(self, multisig_keys_3):
         """Test creating a multisig address."""
-        # Create public keys from private keys (not x-only)
-        priv_key1 = PrivateKey("1" * 64)
-        pub_key1 = priv_key1.to_public_key()
-
-        priv_key2 = PrivateKey("2" * 64)
-        pub_key2 = priv_key2.to_public_key()
-
-        priv_key3 = PrivateKey("3" * 64)
-        pub_key3 = priv_key3.to_public_key()
-
-        # Use PublicKey objects directly
-        keys = [pub_key1, pub_key2, pub_key3]
-
+        # Use PublicKey objects (not x-only) directly
         multisig_address = create_multisig_address(
             minimum_signatures=2,
-            keys=keys,
+            keys=list(multisig_keys_3),
             network_type="mainnet"
         )
 
         assert isinstance(multisig_address, Address)
         assert multisig_address.prefix == "kaspa"
 
-    def test_create_multisig_address_testnet(self):
+    def test_create_multisig_address_testnet(self, multisig_keys_2):
         """Test creating a testnet multisig address."""
-        priv_key1 = PrivateKey("1" * 64)
-        pub_key1 = priv_key1.to_public_key()
-
-        priv_key2 = PrivateKey("2" * 64)
-        pub_key2 = priv_key2.to_public_key()
-
-        # Use PublicKey objects directly
-        keys = [pub_key1, pub_key2]
-
         multisig_address = create_multisig_address(
             minimum_signatures=1,
-            keys=keys,
+            keys=list(multisig_keys_2),
             network_type="testnet"
         )
 
         assert isinstance(multisig_address, Address)
         assert multisig_address.prefix == "kaspatest"
 
-    def test_create_multisig_address_ecdsa(self):
+    def test_create_multisig_address_ecdsa(self, multisig_keys_2):
         """Test creating an ECDSA multisig address."""
-        # For ECDSA, use public keys from private keys
-        priv_key1 = PrivateKey("1" * 64)
-        pub_key1 = priv_key1.to_public_key()
-
-        priv_key2 = PrivateKey("2" * 64)
-        pub_key2 = priv_key2.to_public_key()
-
-        # Use PublicKey objects directly
-        keys = [pub_key1, pub_key2]
-
         multisig_address = create_multisig_address(
             minimum_signatures=1,
-            keys=keys,
+            keys=list(multisig_keys_2),
             network_type="mainnet",
             ecdsa=True
         )
 
         assert isinstance(multisig_address, Address)
+
+    def test_create_multisig_address_key_order(self, multisig_keys_3):
+        """Test the address commits to key order (keys are not sorted)."""
+        keys = list(multisig_keys_3)
+        address = create_multisig_address(2, keys, "mainnet")
+
+        assert create_multisig_address(2, keys, "mainnet") == address
+        assert create_multisig_address(2, keys[::-1], "mainnet") != address
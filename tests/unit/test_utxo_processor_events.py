@@ -1,155 +1,139 @@
+import sys
+from contextlib import contextmanager
+
 import pytest
 
 from kaspa import NetworkId, Resolver, RpcClient, UtxoProcessor, UtxoProcessorEvent
 
+# Keep the module on one xdist worker (`--dist loadgroup`) so the shared
+# processor fixture is built once.
+pytestmark = pytest.mark.xdist_group("utxo_processor_events")
 
-def test_add_event_listener_all_overload_smoke():
-    client = RpcClient(resolver=Resolver(), network_id="testnet-10")
-    processor = UtxoProcessor(client, NetworkId("testnet-10"))
-
-    def cb(event):
-        _ = event
-
-    processor.add_event_listener(cb)
-    processor.remove_event_listener(cb)
-
+_RESOLVER = Resolver()
+_NETWORK_ID = NetworkId("testnet-10")
 
-def test_add_event_listener_specific_event_smoke():
-    client = RpcClient(resolver=Resolver(), network_id="testnet-10")
-    processor = UtxoProcessor(client, NetworkId("testnet-10"))
+# Event targets accepted by add/remove_event_listener.
+_CONNECT = "connect"
+_DISCONNECT = "disconnect"
+_STAR = "*"
+_ALL = "all"
 
-    def cb(event):
-        _ = event
-
-    processor.add_event_listener("connect", cb)
-    processor.remove_event_listener("connect", cb)
-
-
-def test_add_event_listener_multiple_targets_smoke():
-    client = RpcClient(resolver=Resolver(), network_id="testnet-10")
-    processor = UtxoProcessor(client, NetworkId("testnet-10"))
-
-    def cb(event):
-        _ = event
 
-    processor.add_event_listener(["connect", "disconnect"], cb)
-    processor.remove_event_listener(["connect", "disconnect"], cb)
+# Listener registration never connects, so one client/processor pair serves
+# the whole module; listeners are cleared after each test.
+@pytest.fixture(scope="module")
+def processor():
+    client = RpcClient(resolver=_RESOLVER, network_id=_NETWORK_ID)
+    return client, UtxoProcessor(client, _NETWORK_ID)
 
 
-def test_add_event_listener_enum_target_smoke():
-    client = RpcClient(resolver=Resolver(), network_id="testnet-10")
-    processor = UtxoProcessor(client, NetworkId("testnet-10"))
+@pytest.fixture(autouse=True)
+def _reset(processor):
+    yield
+    processor[1].remove_all_event_listeners()
 
-    def cb(event):
-        _ = event
 
-    processor.add_event_listener(UtxoProcessorEvent.Connect, cb)
-    processor.remove_event_listener(UtxoProcessorEvent.Connect, cb)
+# A builtin bound method is callable without a Python frame. This module never
+# connects, so no event is ever dispatched and the list stays empty.
+_NOOP = [].append
 
 
-def test_add_event_listener_mixed_targets_smoke():
-    client = RpcClient(resolver=Resolver(), network_id="testnet-10")
-    processor = UtxoProcessor(client, NetworkId("testnet-10"))
+@contextmanager
+def _listener(processor, target, callback, *args, **kwargs):
+    # `target=None` exercises the callback-only overload.
+    targets = () if target is None else (target,)
+    processor.add_event_listener(*targets, callback, *args, **kwargs)
+    try:
+        yield
+    finally:
+        processor.remove_event_listener(*targets, callback)
 
-    def cb(event):
-        _ = event
 
-    processor.add_event_listener([UtxoProcessorEvent.Connect, "disconnect"], cb)
-    processor.remove_event_listener([UtxoProcessorEvent.Connect, "disconnect"], cb)
+@pytest.mark.parametrize(
+    "target, args, kwargs",
+    [
+        pytest.param(None, (), {}, id="all_overload"),
+        pytest.param(_CONNECT, (), {}, id="specific_event"),
+        pytest.param([_CONNECT, _DISCONNECT], (), {}, id="multiple_targets"),
+        pytest.param(UtxoProcessorEvent.Connect, (), {}, id="enum_target"),
+        pytest.param([UtxoProcessorEvent.Connect, _DISCONNECT], (), {}, id="mixed_targets"),
+        pytest.param(_STAR, (), {}, id="star_target"),
+        pytest.param(_ALL, (), {}, id="all_target_alias"),
+        pytest.param(_CONNECT, (1, 2), {"foo": "bar"}, id="args_kwargs"),
+    ],
+)
+def test_add_remove_event_listener_smoke(processor, target, args, kwargs):
+    _, processor = processor
 
+    with _listener(processor, target, _NOOP, *args, **kwargs):
+        pass
 
-def test_remove_all_event_listeners_smoke():
-    client = RpcClient(resolver=Resolver(), network_id="testnet-10")
-    processor = UtxoProcessor(client, NetworkId("testnet-10"))
 
-    def cb(event):
-        _ = event
+def test_remove_all_event_listeners_smoke(processor):
+    _, processor = processor
 
-    processor.add_event_listener("connect", cb)
+    processor.add_event_listener(_CONNECT, _NOOP)
     processor.remove_all_event_listeners()
 
 
-def test_add_event_listener_invalid_target_raises():
-    client = RpcClient(resolver=Resolver(), network_id="testnet-10")
-    processor = UtxoProcessor(client, NetworkId("testnet-10"))
+def test_remove_event_listener_by_callback_smoke(processor):
+    _, processor = processor
 
     def cb(event):
         _ = event
 
-    with pytest.raises(Exception):
-        processor.add_event_listener("not-a-real-event", cb)
-
-
-def test_add_event_listener_empty_target_raises():
-    client = RpcClient(resolver=Resolver(), network_id="testnet-10")
-    processor = UtxoProcessor(client, NetworkId("testnet-10"))
-
-    def cb(event):
-        _ = event
-
-    with pytest.raises(Exception):
-        processor.add_event_listener("", cb)
-
-
-def test_remove_event_listener_empty_target_raises():
-    client = RpcClient(resolver=Resolver(), network_id="testnet-10")
-    processor = UtxoProcessor(client, NetworkId("testnet-10"))
-
-    def cb(event):
-        _ = event
-
-    with pytest.raises(Exception):
-        processor.remove_event_listener("", cb)
-
-
-def test_add_event_listener_star_target_smoke():
-    client = RpcClient(resolver=Resolver(), network_id="testnet-10")
-    processor = UtxoProcessor(client, NetworkId("testnet-10"))
-
-    def cb(event):
-        _ = event
-
-    processor.add_event_listener("*", cb)
-    processor.remove_event_listener("*", cb)
-
-
-def test_add_event_listener_all_target_alias_smoke():
-    client = RpcClient(resolver=Resolver(), network_id="testnet-10")
-    processor = UtxoProcessor(client, NetworkId("testnet-10"))
-
-    def cb(event):
-        _ = event
-
-    processor.add_event_listener("all", cb)
-    processor.remove_event_listener("all", cb)
-
-
-def test_add_event_listener_args_kwargs_smoke():
-    client = RpcClient(resolver=Resolver(), network_id="testnet-10")
-    processor = UtxoProcessor(client, NetworkId("testnet-10"))
-
-    def cb(event):
-        _ = event
-
-    processor.add_event_listener("connect", cb, 1, 2, foo="bar")
-    processor.remove_event_listener("connect", cb)
-
-
-def test_remove_event_listener_by_callback_smoke():
-    client = RpcClient(resolver=Resolver(), network_id="testnet-10")
-    processor = UtxoProcessor(client, NetworkId("testnet-10"))
-
-    def cb(event):
-        _ = event
-
-    processor.add_event_listener("connect", cb)
-    processor.add_event_listener("disconnect", cb)
+    processor.add_event_listener(_CONNECT, cb)
+    processor.add_event_listener(_DISCONNECT, cb)
     processor.remove_event_listener(cb)
 
 
-def test_add_event_listener_missing_callback_raises():
-    client = RpcClient(resolver=Resolver(), network_id="testnet-10")
-    processor = UtxoProcessor(client, NetworkId("testnet-10"))
+# The processor holds a reference to each registered callback, so refcounts
+# show which listeners it still keeps.
+@pytest.mark.parametrize("n", [1, 100])
+def test_many_event_listeners(processor, n):
+    _, processor = processor
+    callbacks = [[].append for _ in range(n)]
+    baseline = [sys.getrefcount(cb) for cb in callbacks]
+
+    for cb in callbacks:
+        processor.add_event_listener(_CONNECT, cb)
+    assert [sys.getrefcount(cb) for cb in callbacks] == [ref + 1 for ref in baseline]
+    for cb in reversed(callbacks):
+        processor.remove_event_listener(_CONNECT, cb)
+    assert [sys.getrefcount(cb) for cb in callbacks] == baseline
 
-    with pytest.raises(Exception):
-        processor.add_event_listener("connect")
+    for cb in callbacks:
+        processor.add_event_listener(_CONNECT, cb)
+    processor.remove_all_event_listeners()
+    assert [sys.getrefcount(cb) for cb in callbacks] == baseline
+
+
+@pytest.mark.parametrize(
+    "op, match",
+    [
+        pytest.param(
+            lambda p: p.add_event_listener("not-a-real-event", _NOOP),
+            r"(?i)invalid",
+            id="invalid_target",
+        ),
+        pytest.param(
+            lambda p: p.add_event_listener("", _NOOP), r"(?i)invalid", id="empty_target"
+        ),
+        pytest.param(
+            lambda p: p.remove_event_listener("", _NOOP),
+            r"(?i)invalid",
+            id="remove_empty_target",
+        ),
+        pytest.param(
+            lambda p: p.add_event_listener(_CONNECT), "to be callable", id="missing_callback"
+        ),
+    ],
+)
+def test_event_listener_errors(processor, op, match):
+    _, processor = processor
+
+    # The binding raises a bare `Exception`; subclasses such as `TypeError`
+    # would point at a broken call rather than a rejected target.
+    with pytest.raises(Exception, match=match) as exc_info:
+        op(processor)
+    assert exc_info.type is Exception